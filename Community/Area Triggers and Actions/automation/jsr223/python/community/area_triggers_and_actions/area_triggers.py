@@ -16,7 +16,7 @@ from community.area_triggers_and_actions import start_action
 
 from core.rules import rule
 from core.triggers import when
-from core.metadata import get_metadata, get_key_value
+from core.metadata import get_metadata, get_key_value, items_with_namespace
 from core.actions import PersistenceExtensions
 
 DEFAULT_ACTION_FUNCTION = AREA_TRIGGERS_AND_ACTIONS_CONFIGURATION.get("default_action_function") or "light_action"
@@ -62,7 +62,7 @@ def area_triggers(event):
 # The following rule will update the lights using the default_action_function
 def lux_trigger_generator():
     def generated_triggers(function):
-        lux_item_names = list(set([get_key_value(item.name, "area_triggers_and_actions", DEFAULT_ACTION_FUNCTION, "lux_item_name") for item in itemRegistry.getAll() if get_key_value(item.name, "area_triggers_and_actions", "light_action", "lux_item_name")]))
+        lux_item_names = list(set([get_key_value(item_name, "area_triggers_and_actions", DEFAULT_ACTION_FUNCTION, "lux_item_name") for item_name in items_with_namespace("area_triggers_and_actions") if get_key_value(item_name, "area_triggers_and_actions", "light_action", "lux_item_name")]))
         for lux_item_name in lux_item_names:
             when("Item {} changed".format(lux_item_name))(function)
         return function
@@ -10,7 +10,7 @@ __all__ = ['light_action', 'toggle_action']
 #from org.joda.time import DateTime
 
 from core.jsr223.scope import events, items, PercentType, DecimalType, HSBType, ON, OFF, OnOffType
-from core.metadata import get_key_value
+from core.metadata import metadata_path
 from core.log import logging, LOG_PREFIX, log_traceback
 
 import configuration
@@ -20,6 +20,7 @@ from configuration import AREA_TRIGGERS_AND_ACTIONS_CONFIGURATION
 MODE_ITEM = AREA_TRIGGERS_AND_ACTIONS_CONFIGURATION.get("mode_item") or "Mode"
 DISABLE_AUTOMATION_BRIGHTNESS = AREA_TRIGGERS_AND_ACTIONS_CONFIGURATION.get("disable_automation_brightness") or 100
 LOG = logging.getLogger(u"{}.community.area_triggers_and_actions.area_actions".format(LOG_PREFIX))
+LIGHT_ACTION_METADATA = metadata_path("area_triggers_and_actions", "light_action")
 
 
 @log_traceback
@@ -39,7 +40,7 @@ def light_action(item, active):
         boolean active: Area activity (True for active and False for inactive)
     """
     #start_time = DateTime.now().getMillis()
-    item_metadata = get_key_value(item.name, "area_triggers_and_actions", "light_action")
+    item_metadata = LIGHT_ACTION_METADATA.get(item.name) or {}
     lux_item_name = item_metadata.get("lux_item_name", AREA_TRIGGERS_AND_ACTIONS_CONFIGURATION["light_action"].get("lux_item_name"))
     trigger_type = "active" if active else "inactive"
     lux_trigger = item_metadata.get(trigger_type, {}).get("modes", {}).get(items[MODE_ITEM].toString(), {}).get("lux_trigger", AREA_TRIGGERS_AND_ACTIONS_CONFIGURATION["light_action"]["default_levels"][trigger_type]["lux_trigger"])
@@ -111,19 +111,20 @@ from core.log import logging, LOG_PREFIX, log_traceback
 @log_traceback
 def remove_owm_items():
     remove_owm_items.log = logging.getLogger("{}.remove_owm_items".format(LOG_PREFIX))
-    from core.items import remove_item
+    from core.items import remove_items
 
-    for item in itemRegistry.getItemsByTag("OpenWeatherMap"):
+    owm_items = itemRegistry.getItemsByTag("OpenWeatherMap")
+    for item in owm_items:
         remove_owm_items.log.debug(u"'{}'".format(item))
-        remove_item(item)
+    remove_items(owm_items)
 
     # use this as a last resort, but make sure it's not removing any Items that
     # were not created by this script
 
-    # for item in itemRegistry.getAll():
-    #     if "Forecast_" in item.name or "Current_" in item.name:
-    #         remove_owm_items.log.debug(u"'{}'".format(item))
-    #         remove_item(item)
+    # owm_items = [item for item in itemRegistry.getAll() if "Forecast_" in item.name or "Current_" in item.name]
+    # for item in owm_items:
+    #     remove_owm_items.log.debug(u"'{}'".format(item))
+    # remove_items(owm_items)# this also removes their Links with remove_links
 
 
 #remove_owm_items()
@@ -139,18 +140,16 @@ def add_owm_items():
 
     try:
         from org.openhab.core.thing import ThingTypeUID
-        from org.openhab.core.thing import ChannelUID
     except:
         from org.eclipse.smarthome.core.thing import ThingTypeUID
-        from org.eclipse.smarthome.core.thing import ChannelUID
 
     try:
         from org.eclipse.smarthome.core.library.types import QuantityTypeArithmeticGroupFunction
     except:
         from org.openhab.core.library.types import QuantityTypeArithmeticGroupFunction
 
-    from core.items import add_item
-    from core.links import add_link
+    from core.items import add_items
+    from core.links import add_links
 
     try:
         owm_thing_uid = None
@@ -218,137 +217,88 @@ def add_owm_items():
                     return
 
             # create Current group and Items
-            if itemRegistry.getItems("gOpenWeatherMap") == []:
-                add_item("gOpenWeatherMap", item_type="Group", groups=["gWeather"], label="OpenWeatherMap", tags=["OpenWeatherMap"])
-            if itemRegistry.getItems("gCurrent") == []:
-                add_item("gCurrent", item_type="Group", groups=["gOpenWeatherMap"], label="Current", tags=["OpenWeatherMap"])
-            if itemRegistry.getItems("Current_Timestamp") == []:
-                add_item("Current_Timestamp", item_type="DateTime", groups=["gCurrent", "gForecast_Timestamp_1"], label="Current: Timestamp [%1$tY-%1$tm-%1$td %1$tI:%1$tM%1$tp]", category="Time", tags=["OpenWeatherMap"])
-                add_link("Current_Timestamp", ChannelUID(owm_thing_uid + ":current#time-stamp"))
-            if itemRegistry.getItems("Current_Condition") == []:
-                add_item("Current_Condition", item_type="String", groups=["gCurrent", "gForecast_Condition_1"], label="Current: Condition [%s]", category="Sun_Clouds", tags=["OpenWeatherMap"])
-                add_link("Current_Condition", ChannelUID(owm_thing_uid + ":current#condition"))
-            if itemRegistry.getItems("Current_ConditionID") == []:
-                add_item("Current_ConditionID", item_type="String", groups=["gCurrent", "gForecast_ConditionID_1"], label="Current: Condition ID [%s]", tags=["OpenWeatherMap"])
-                add_link("Current_ConditionID", ChannelUID(owm_thing_uid + ":current#condition-id"))
-            if itemRegistry.getItems("Current_IconID") == []:
-                add_item("Current_IconID", item_type="String", groups=["gCurrent", "gForecast_IconID_1"], label="Current: Icon ID [%s]", tags=["OpenWeatherMap"])
-                add_link("Current_IconID", ChannelUID(owm_thing_uid + ":current#icon-id"))
-            if itemRegistry.getItems("Current_Icon") == []:
-                add_item("Current_Icon", item_type="Image", groups=["gCurrent", "gForecast_Icon_1"], label="Current: Icon", tags=["OpenWeatherMap"])
-                add_link("Current_Icon", ChannelUID(owm_thing_uid + ":current#icon"))
-            if itemRegistry.getItems("Current_Temperature") == []:
-                add_item("Current_Temperature", item_type="Number:Temperature", groups=["gCurrent", "gForecast_Temperature_High_1", "gForecast_Temperature_Low_1"], label="Current: Temperature [%.0f %unit%]", category="Temperature", tags=["OpenWeatherMap"])
-                add_link("Current_Temperature", ChannelUID(owm_thing_uid + ":current#temperature"))
-            if itemRegistry.getItems("Current_Pressure") == []:
-                add_item("Current_Pressure", item_type="Number:Pressure", groups=["gCurrent", "gForecast_Pressure_1"], label="Current: Pressure [%.1f %unit%]", category="Pressure", tags=["OpenWeatherMap"])
-                add_link("Current_Pressure", ChannelUID(owm_thing_uid + ":current#pressure"))
-            if itemRegistry.getItems("Current_Humidity") == []:
-                add_item("Current_Humidity", item_type="Number:Dimensionless", groups=["gCurrent", "gForecast_Humidity_1"], label="Current: Humidity [%d %%]", category="Humidity", tags=["OpenWeatherMap"])
-                add_link("Current_Humidity", ChannelUID(owm_thing_uid + ":current#humidity"))
-            if itemRegistry.getItems("Current_WindSpeed") == []:
-                add_item("Current_WindSpeed", item_type="Number:Speed", groups=["gCurrent", "gForecast_WindSpeed_1"], label="Current: Wind speed [%.0f %unit%]", category="Wind", tags=["OpenWeatherMap"])
-                add_link("Current_WindSpeed", ChannelUID(owm_thing_uid + ":current#wind-speed"))
-            if itemRegistry.getItems("Current_GustSpeed") == []:
-                add_item("Current_GustSpeed", item_type="Number:Speed", groups=["gCurrent", "gForecast_GustSpeed_1"], label="Current: Gust speed [%.0f %unit%]", category="Wind", tags=["OpenWeatherMap"])
-                add_link("Current_GustSpeed", ChannelUID(owm_thing_uid + ":current#gust-speed"))
-            if itemRegistry.getItems("Current_WindDirection") == []:
-                add_item("Current_WindDirection", item_type="Number:Angle", groups=["gCurrent", "gForecast_WindDirection_1"], label="Current: Wind direction [SCALE(windDirection.scale):%s]", category="Wind", tags=["OpenWeatherMap"])
-                add_link("Current_WindDirection", ChannelUID(owm_thing_uid + ":current#wind-direction"))
-            if itemRegistry.getItems("Current_Cloudiness") == []:
-                add_item("Current_Cloudiness", item_type="Number:Dimensionless", groups=["gCurrent", "gForecast_Cloudiness_1"], label="Current: Cloudiness [%d %%]", category="Sun_Clouds", tags=["OpenWeatherMap"])
-                add_link("Current_Cloudiness", ChannelUID(owm_thing_uid + ":current#cloudiness"))
-            if itemRegistry.getItems("Current_RainVolume") == []:
-                add_item("Current_RainVolume", item_type="Number:Length", groups=["gCurrent", "gForecast_RainVolume_1"], label="Current: Rain volume [%.1f %unit%]", category="Rain", tags=["OpenWeatherMap"])
-                add_link("Current_RainVolume", ChannelUID(owm_thing_uid + ":current#rain"))
-            if itemRegistry.getItems("Current_SnowVolume") == []:
-                add_item("Current_SnowVolume", item_type="Number:Length", groups=["gCurrent", "gForecast_SnowVolume_1"], label="Current: Snow volume [%.1f %unit%]", category="Snow", tags=["OpenWeatherMap"])
-                add_link("Current_SnowVolume", ChannelUID(owm_thing_uid + ":current#snow"))
+            item_specs = [
+                {"item_name": "gOpenWeatherMap", "item_type": "Group", "groups": ["gWeather"], "label": "OpenWeatherMap", "tags": ["OpenWeatherMap"]},
+                {"item_name": "gCurrent", "item_type": "Group", "groups": ["gOpenWeatherMap"], "label": "Current", "tags": ["OpenWeatherMap"]}
+            ]
+            links = []
+            # (name, type, forecast groups, label, category, channel)
+            current_items = [
+                ("Timestamp", "DateTime", ["gForecast_Timestamp_1"], "Timestamp [%1$tY-%1$tm-%1$td %1$tI:%1$tM%1$tp]", "Time", "time-stamp"),
+                ("Condition", "String", ["gForecast_Condition_1"], "Condition [%s]", "Sun_Clouds", "condition"),
+                ("ConditionID", "String", ["gForecast_ConditionID_1"], "Condition ID [%s]", None, "condition-id"),
+                ("IconID", "String", ["gForecast_IconID_1"], "Icon ID [%s]", None, "icon-id"),
+                ("Icon", "Image", ["gForecast_Icon_1"], "Icon", None, "icon"),
+                ("Temperature", "Number:Temperature", ["gForecast_Temperature_High_1", "gForecast_Temperature_Low_1"], "Temperature [%.0f %unit%]", "Temperature", "temperature"),
+                ("Pressure", "Number:Pressure", ["gForecast_Pressure_1"], "Pressure [%.1f %unit%]", "Pressure", "pressure"),
+                ("Humidity", "Number:Dimensionless", ["gForecast_Humidity_1"], "Humidity [%d %%]", "Humidity", "humidity"),
+                ("WindSpeed", "Number:Speed", ["gForecast_WindSpeed_1"], "Wind speed [%.0f %unit%]", "Wind", "wind-speed"),
+                ("GustSpeed", "Number:Speed", ["gForecast_GustSpeed_1"], "Gust speed [%.0f %unit%]", "Wind", "gust-speed"),
+                ("WindDirection", "Number:Angle", ["gForecast_WindDirection_1"], "Wind direction [SCALE(windDirection.scale):%s]", "Wind", "wind-direction"),
+                ("Cloudiness", "Number:Dimensionless", ["gForecast_Cloudiness_1"], "Cloudiness [%d %%]", "Sun_Clouds", "cloudiness"),
+                ("RainVolume", "Number:Length", ["gForecast_RainVolume_1"], "Rain volume [%.1f %unit%]", "Rain", "rain"),
+                ("SnowVolume", "Number:Length", ["gForecast_SnowVolume_1"], "Snow volume [%.1f %unit%]", "Snow", "snow")
+            ]
+            for name, item_type, forecast_groups, label, category, channel in current_items:
+                item_specs.append({"item_name": "Current_" + name, "item_type": item_type, "groups": ["gCurrent"] + forecast_groups, "label": "Current: " + label, "category": category, "tags": ["OpenWeatherMap"]})
+                links.append(("Current_" + name, owm_thing_uid + ":current#" + channel))
+            add_items(item_specs)
 
             # create Forecast groups
             import calendar
             from org.joda.time import DateTime
             last_reading = DateTime(str(items["Current_Timestamp"])).getDayOfWeek() - 1
+            # (name, label, category, base type, group function)
+            forecast_groups = [
+                ("Timestamp", "Timestamp [%1$tY-%1$tm-%1$td %1$tI:%1$tM%1$tp]", "Time", None, None),
+                ("Condition", "Condition [%s]", "Sun_Clouds", "String", None),
+                ("ConditionID", "Condition ID [%s]", None, "String", None),
+                ("IconID", "Icon ID [%s]", None, "String", None),
+                ("Icon", "Icon", None, "Image", None),
+                ("Temperature_High", "Temperature (high) [%.0f %unit%]", "Temperature_Hot", "Number:Temperature", QuantityTypeArithmeticGroupFunction.Max(Temperature)),
+                ("Temperature_Low", "Temperature (low) [%.0f %unit%]", "Temperature_Cold", "Number:Temperature", QuantityTypeArithmeticGroupFunction.Min(Temperature)),
+                ("Pressure", "Pressure [%.1f %unit%]", "Pressure", "Number:Pressure", QuantityTypeArithmeticGroupFunction.Max(Pressure)),
+                ("Humidity", "Humidity [%d %%]", "Humidity", "Number:Dimensionless", QuantityTypeArithmeticGroupFunction.Max(Dimensionless)),
+                ("WindSpeed", "Wind Speed [%.0f %unit%]", "Wind", "Number:Speed", QuantityTypeArithmeticGroupFunction.Max(Speed)),
+                ("GustSpeed", "Gust Speed [%.0f %unit%]", "Wind", "Number:Speed", QuantityTypeArithmeticGroupFunction.Max(Speed)),
+                #("WindDirection", "Wind direction [SCALE(windDirection.scale):%s]", "Wind", "Number:Angle", QuantityTypeArithmeticGroupFunction.Avg(Angle)),# this doesn't work properly yet
+                ("WindDirection", "Wind direction [SCALE(windDirection.scale):%s]", "Wind", "Number:Angle", None),
+                ("Cloudiness", "Cloudiness [%d %%]", "Sun_Clouds", "Number:Dimensionless", QuantityTypeArithmeticGroupFunction.Max(Dimensionless)),
+                ("RainVolume", "Rain Volume [%.1f %unit%]", "Rain", "Number:Length", QuantityTypeArithmeticGroupFunction.Sum(Length)),
+                ("SnowVolume", "Snow Volume [%.1f %unit%]", "Snow", "Number:Length", QuantityTypeArithmeticGroupFunction.Sum(Length))
+            ]
+            item_specs = []
             for index in range(1, 6):
                 day_of_the_week = "Today" if index == 1 else calendar.day_name[(last_reading + index - 1) % 7]
-                if itemRegistry.getItems("gForecast_" + str(index)) == []:
-                    add_item("gForecast_" + str(index), item_type="Group", groups=["gOpenWeatherMap"], label=day_of_the_week, tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Timestamp_" + str(index)) == []:
-                    add_item("gForecast_Timestamp_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Timestamp [%1$tY-%1$tm-%1$td %1$tI:%1$tM%1$tp]", category="Time", tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Condition_" + str(index)) == []:
-                    add_item("gForecast_Condition_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Condition [%s]", gi_base_type="String", category="Sun_Clouds", tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_ConditionID_" + str(index)) == []:
-                    add_item("gForecast_ConditionID_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Condition ID [%s]", gi_base_type="String", tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_IconID_" + str(index)) == []:
-                    add_item("gForecast_IconID_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Icon ID [%s]", gi_base_type="String", tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Icon_" + str(index)) == []:
-                    add_item("gForecast_Icon_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Icon", gi_base_type="Image", tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Temperature_High_" + str(index)) == []:
-                    add_item("gForecast_Temperature_High_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Temperature (high) [%.0f %unit%]", category="Temperature_Hot", gi_base_type="Number:Temperature", group_function=QuantityTypeArithmeticGroupFunction.Max(Temperature), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Temperature_Low_" + str(index)) == []:
-                    add_item("gForecast_Temperature_Low_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Temperature (low) [%.0f %unit%]", category="Temperature_Cold", gi_base_type="Number:Temperature", group_function=QuantityTypeArithmeticGroupFunction.Min(Temperature), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Pressure_" + str(index)) == []:
-                    add_item("gForecast_Pressure_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Pressure [%.1f %unit%]", category="Pressure", gi_base_type="Number:Pressure", group_function=QuantityTypeArithmeticGroupFunction.Max(Pressure), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Humidity_" + str(index)) == []:
-                    add_item("gForecast_Humidity_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Humidity [%d %%]", category="Humidity", gi_base_type="Number:Dimensionless", group_function=QuantityTypeArithmeticGroupFunction.Max(Dimensionless), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_WindSpeed_" + str(index)) == []:
-                    add_item("gForecast_WindSpeed_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Wind Speed [%.0f %unit%]", category="Wind", gi_base_type="Number:Speed", group_function=QuantityTypeArithmeticGroupFunction.Max(Speed), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_GustSpeed_" + str(index)) == []:
-                    add_item("gForecast_GustSpeed_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Gust Speed [%.0f %unit%]", category="Wind", gi_base_type="Number:Speed", group_function=QuantityTypeArithmeticGroupFunction.Max(Speed), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_WindDirection_" + str(index)) == []:
-                    #add_item("gForecast_WindDirection_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Wind direction [SCALE(windDirection.scale):%s]", category="Wind", gi_base_type="Number:Angle", group_function=QuantityTypeArithmeticGroupFunction.Avg(Angle), tags=["OpenWeatherMap"])# this doesn't work properly yet
-                    add_item("gForecast_WindDirection_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Wind direction [SCALE(windDirection.scale):%s]", category="Wind", gi_base_type="Number:Angle", tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_Cloudiness_" + str(index)) == []:
-                    add_item("gForecast_Cloudiness_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Cloudiness [%d %%]", category="Sun_Clouds", gi_base_type="Number:Dimensionless", group_function=QuantityTypeArithmeticGroupFunction.Max(Dimensionless), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_RainVolume_" + str(index)) == []:
-                    add_item("gForecast_RainVolume_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Rain Volume [%.1f %unit%]", category="Rain", gi_base_type="Number:Length", group_function=QuantityTypeArithmeticGroupFunction.Sum(Length), tags=["OpenWeatherMap"])
-                if itemRegistry.getItems("gForecast_SnowVolume_" + str(index)) == []:
-                    add_item("gForecast_SnowVolume_" + str(index), item_type="Group", groups=["gForecast_" + str(index)], label=day_of_the_week + ": Snow Volume [%.1f %unit%]", category="Snow", gi_base_type="Number:Length", group_function=QuantityTypeArithmeticGroupFunction.Sum(Length), tags=["OpenWeatherMap"])
+                item_specs.append({"item_name": "gForecast_" + str(index), "item_type": "Group", "groups": ["gOpenWeatherMap"], "label": day_of_the_week, "tags": ["OpenWeatherMap"]})
+                for name, label, category, gi_base_type, group_function in forecast_groups:
+                    item_specs.append({"item_name": "gForecast_{}_{}".format(name, index), "item_type": "Group", "groups": ["gForecast_" + str(index)], "label": day_of_the_week + ": " + label, "category": category, "gi_base_type": gi_base_type, "group_function": group_function, "tags": ["OpenWeatherMap"]})
 
             # create Forecast Items
+            # (name, type, label, category, channel)
+            forecast_items = [
+                ("Timestamp", "DateTime", "Timestamp [%1$tY-%1$tm-%1$td %1$tI:%1$tM%1$tp]", "Time", "time-stamp"),
+                ("Condition", "String", "Condition [%s]", "Sun_Clouds", "condition"),
+                ("ConditionID", "String", "Condition ID [%s]", None, "condition-id"),
+                ("IconID", "String", "Icon ID [%s]", None, "icon-id"),
+                ("Icon", "Image", "Icon", None, "icon"),
+                ("Temperature", "Number:Temperature", "Temperature [%.0f %unit%]", "Temperature", "temperature"),
+                ("Pressure", "Number:Pressure", "Pressure [%.1f %unit%]", "Pressure", "pressure"),
+                ("Humidity", "Number:Dimensionless", "Humidity [%d %%]", "Humidity", "humidity"),
+                ("WindSpeed", "Number:Speed", "Wind speed [%.0f %unit%]", "Wind", "wind-speed"),
+                ("GustSpeed", "Number:Speed", "Gust speed [%.0f %unit%]", "Wind", "gust-speed"),
+                ("WindDirection", "Number:Angle", "Wind direction [SCALE(windDirection.scale):%s]", "Wind", "wind-direction"),
+                ("Cloudiness", "Number:Dimensionless", "Cloudiness [%d %%]", "Sun_Clouds", "cloudiness"),
+                ("RainVolume", "Number:Length", "Rain volume [%.1f %unit%]", "Rain", "rain"),
+                ("SnowVolume", "Number:Length", "Snow volume [%.1f %unit%]", "Snow", "snow")
+            ]
             for index in range(1, 41):
-                if itemRegistry.getItems("Forecast_Timestamp_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Timestamp_{:02d}".format(3 * index), item_type="DateTime", label="Forecast ({:02d}): Timestamp [%1$tY-%1$tm-%1$td %1$tI:%1$tM%1$tp]".format(3 * index), category="Time", tags=["OpenWeatherMap"])
-                    add_link("Forecast_Timestamp_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#time-stamp".format(3 * index)))
-                if itemRegistry.getItems("Forecast_Condition_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Condition_{:02d}".format(3 * index), item_type="String", label="Forecast ({:02d}): Condition [%s]".format(3 * index), category="Sun_Clouds", tags=["OpenWeatherMap"])
-                    add_link("Forecast_Condition_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#condition".format(3 * index)))
-                if itemRegistry.getItems("Forecast_ConditionID_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_ConditionID_{:02d}".format(3 * index), item_type="String", label="Forecast ({:02d}): Condition ID [%s]".format(3 * index), tags=["OpenWeatherMap"])
-                    add_link("Forecast_ConditionID_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#condition-id".format(3 * index)))
-                if itemRegistry.getItems("Forecast_IconID_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_IconID_{:02d}".format(3 * index), item_type="String", label="Forecast ({:02d}): Icon ID [%s]".format(3 * index), tags=["OpenWeatherMap"])
-                    add_link("Forecast_IconID_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#icon-id".format(3 * index)))
-                if itemRegistry.getItems("Forecast_Icon_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Icon_{:02d}".format(3 * index), item_type="Image", label="Forecast ({:02d}): Icon".format(3 * index), tags=["OpenWeatherMap"])
-                    add_link("Forecast_Icon_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#icon".format(3 * index)))
-                if itemRegistry.getItems("Forecast_Temperature_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Temperature_{:02d}".format(3 * index), item_type="Number:Temperature", label="Forecast ({:02d}): Temperature [%.0f %unit%]".format(3 * index), category="Temperature", tags=["OpenWeatherMap"])
-                    add_link("Forecast_Temperature_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#temperature".format(3 * index)))
-                if itemRegistry.getItems("Forecast_Pressure_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Pressure_{:02d}".format(3 * index), item_type="Number:Pressure", label="Forecast ({:02d}): Pressure [%.1f %unit%]".format(3 * index), category="Pressure", tags=["OpenWeatherMap"])
-                    add_link("Forecast_Pressure_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#pressure".format(3 * index)))
-                if itemRegistry.getItems("Forecast_Humidity_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Humidity_{:02d}".format(3 * index), item_type="Number:Dimensionless", label="Forecast ({:02d}): Humidity [%d %%]".format(3 * index), category="Humidity", tags=["OpenWeatherMap"])
-                    add_link("Forecast_Humidity_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#humidity".format(3 * index)))
-                if itemRegistry.getItems("Forecast_WindSpeed_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_WindSpeed_{:02d}".format(3 * index), item_type="Number:Speed", label="Forecast ({:02d}): Wind speed [%.0f %unit%]".format(3 * index), category="Wind", tags=["OpenWeatherMap"])
-                    add_link("Forecast_WindSpeed_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#wind-speed".format(3 * index)))
-                if itemRegistry.getItems("Forecast_GustSpeed_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_GustSpeed_{:02d}".format(3 * index), item_type="Number:Speed", label="Forecast ({:02d}): Gust speed [%.0f %unit%]".format(3 * index), category="Wind", tags=["OpenWeatherMap"])
-                    add_link("Forecast_GustSpeed_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#gust-speed".format(3 * index)))
-                if itemRegistry.getItems("Forecast_WindDirection_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_WindDirection_{:02d}".format(3 * index), item_type="Number:Angle", label="Forecast ({:02d}): Wind direction [SCALE(windDirection.scale):%s]".format(3 * index), category="Wind", tags=["OpenWeatherMap"])
-                    add_link("Forecast_WindDirection_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#wind-direction".format(3 * index)))
-                if itemRegistry.getItems("Forecast_Cloudiness_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_Cloudiness_{:02d}".format(3 * index), item_type="Number:Dimensionless", label="Forecast ({:02d}): Cloudiness [%d %%]".format(3 * index), category="Sun_Clouds", tags=["OpenWeatherMap"])
-                    add_link("Forecast_Cloudiness_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#cloudiness".format(3 * index)))
-                if itemRegistry.getItems("Forecast_RainVolume_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_RainVolume_{:02d}".format(3 * index), item_type="Number:Length", label="Forecast ({:02d}): Rain volume [%.1f %unit%]".format(3 * index), category="Rain", tags=["OpenWeatherMap"])
-                    add_link("Forecast_RainVolume_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#rain".format(3 * index)))
-                if itemRegistry.getItems("Forecast_SnowVolume_{:02d}".format(3 * index)) == []:
-                    add_item("Forecast_SnowVolume_{:02d}".format(3 * index), item_type="Number:Length", label="Forecast ({:02d}): Snow volume [%.1f %unit%]".format(3 * index), category="Snow", tags=["OpenWeatherMap"])
-                    add_link("Forecast_SnowVolume_{:02d}".format(3 * index), ChannelUID(owm_thing_uid + ":forecastHours{:02d}#snow".format(3 * index)))
+                for name, item_type, label, category, channel in forecast_items:
+                    item_name = "Forecast_{}_{:02d}".format(name, 3 * index)
+                    item_specs.append({"item_name": item_name, "item_type": item_type, "label": "Forecast ({:02d}): ".format(3 * index) + label, "category": category, "tags": ["OpenWeatherMap"]})
+                    links.append((item_name, owm_thing_uid + ":forecastHours{:02d}#{}".format(3 * index, channel)))
+            add_items(item_specs)
+            add_links(links)
 
             from core.rules import rule
             from core.triggers import when
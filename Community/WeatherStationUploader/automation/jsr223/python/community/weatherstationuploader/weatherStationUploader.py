@@ -98,7 +98,7 @@ from org.joda.time.format import DateTimeFormat
 from core.date import format_date
 from core.rules import rule
 from core.triggers import when
-from core.utils import getItemValue, getLastUpdate
+from core.utils import item_float, item_int, last_update
 from configuration import weatherStationUploader_configuration, customDateTimeFormats
 
 wu_second_count = 10 # Loop counter
@@ -123,6 +123,16 @@ def lux_to_watts_m2(lux):
     # return int(round(float(lux) * 0.01464128843))
     return int(round(float(lux) * 0.015454545))
 
+# State accessors for every sensor Item in the configuration, keyed by Item name,
+# so that reading a sensor in the rule does not need to look the Item up again
+sensor_names = set()
+for sensor_entry in weatherStationUploader_configuration['sensors'].values():
+    for sensor_name in (sensor_entry if isinstance(sensor_entry, list) else [sensor_entry]):
+        if sensor_name is not None:
+            sensor_names.add(sensor_name)
+float_sensors = dict((sensor_name, item_float(sensor_name, 0.0)) for sensor_name in sensor_names)
+int_sensors = dict((sensor_name, item_int(sensor_name, 0)) for sensor_name in sensor_names)
+
 def getTheSensor(lbl, never_assume_dead=False, getHighest=False, getLowest=False):
     # Each sensor entry in the configuration file can be a a single item name or a python list where you can
     # define multiple sensor names. The first sensor in that list that has reported within the value set in
@@ -133,10 +143,11 @@ def getTheSensor(lbl, never_assume_dead=False, getHighest=False, getLowest=False
     sensor_dead_after_mins = weatherStationUploader_configuration['sensor_dead_after_mins'] # The time after which a sensor is presumed to be dead
 
     def isSensorAlive(sName):
-        if getLastUpdate(itemRegistry.getItem(sName)).isAfter(DateTime.now().minusMinutes(sensor_dead_after_mins)):
+        lastUpdate = DateTime(last_update(sName) or 0)
+        if lastUpdate.isAfter(DateTime.now().minusMinutes(sensor_dead_after_mins)):
             return True
         else:
-            weatherStationUploader.log.warn(u"Sensor device {} has not reported since: {}".format(sName, format_date(getLastUpdate(itemRegistry.getItem(sName)), customDateTimeFormats['dateTime'])))
+            weatherStationUploader.log.warn(u"Sensor device {} has not reported since: {}".format(sName, format_date(lastUpdate, customDateTimeFormats['dateTime'])))
             return False
 
     sensorName = None
@@ -151,12 +162,12 @@ def getTheSensor(lbl, never_assume_dead=False, getHighest=False, getLowest=False
                 # Get the first sensor that is not dead and find the sensor with the highest or the lowest value if requested
                 if never_assume_dead or isSensorAlive(s):
                     if getHighest:
-                        _itemValue = getItemValue(s, 0)
+                        _itemValue = int_sensors[s]()
                         if _itemValue > _highestValue:
                             _highestValue = _itemValue
                             sensorName = s
                     elif getLowest:
-                        _itemValue = getItemValue(s, 0)
+                        _itemValue = int_sensors[s]()
                         if _itemValue < _lowestValue:
                             _lowestValue = _itemValue
                             sensorName = s
@@ -190,19 +201,19 @@ def weatherStationUploader(event):
         temp = None
         sensorName = getTheSensor('tempc', getLowest=True)
         if sensorName is not None:
-            temp = Temp(getItemValue(sensorName, 0.0), 'c') # Outdoor temp, c - celsius, f - fahrenheit, k - kelvin
+            temp = Temp(float_sensors[sensorName](), 'c') # Outdoor temp, c - celsius, f - fahrenheit, k - kelvin
             tempf = str(round(temp.f, 1))
 
         soiltempf = None
         sensorName = getTheSensor('soiltempc')
         if sensorName is not None:
-            _temp = Temp(getItemValue(sensorName, 0.0), 'c') # Soil temp, c - celsius, f - fahrenheit, k - kelvin
+            _temp = Temp(float_sensors[sensorName](), 'c') # Soil temp, c - celsius, f - fahrenheit, k - kelvin
             soiltempf = str(round(_temp.f, 1))
 
         humidity = None
         sensorName = getTheSensor('humidity')
         if sensorName is not None:
-            humidity = getItemValue(sensorName, 0.0)
+            humidity = float_sensors[sensorName]()
 
         dewptf = None
         heatidxf = None
@@ -213,69 +224,69 @@ def weatherStationUploader(event):
         pressure = None
         sensorName = getTheSensor('pressurembar')
         if sensorName is not None:
-            _mbar = getItemValue(sensorName, 0)
+            _mbar = int_sensors[sensorName]()
             if ((_mbar < 1070) and (_mbar > 920)):
                 pressure = str(mbar_to_inches_mercury(_mbar))
 
         rainin = None
         sensorName = getTheSensor('rainhour', never_assume_dead=True)
         if sensorName is not None:
-            rainin = str(mm_to_inch(getItemValue(sensorName, 0.0)))
+            rainin = str(mm_to_inch(float_sensors[sensorName]()))
 
         dailyrainin = None
         sensorName = getTheSensor('raintoday', never_assume_dead=True)
         if sensorName is not None:
-            dailyrainin = str(mm_to_inch(getItemValue(sensorName, 0.0)))
+            dailyrainin = str(mm_to_inch(float_sensors[sensorName]()))
 
         soilmoisture = None
         sensorName = getTheSensor('soilmoisture')
         if sensorName is not None:
-            soilmoisture = str(int(round(getItemValue(sensorName, 0.0) * 100 / 1023)))
+            soilmoisture = str(int(round(float_sensors[sensorName]() * 100 / 1023)))
 
         winddir = None
         sensorName = getTheSensor('winddir')
         if sensorName is not None:
-            winddir = str(getItemValue(sensorName, 0))
+            winddir = str(int_sensors[sensorName]())
 
         windspeedmph = None
         sensorName = getTheSensor('windspeedms')
         if sensorName is not None:
-            windspeedmph = str(ms_to_mph(getItemValue(sensorName, 0.0)))
+            windspeedmph = str(ms_to_mph(float_sensors[sensorName]()))
 
         windgustmph = None
         sensorName = getTheSensor('windgustms')
         if sensorName is not None:
-            windgustmph = str(ms_to_mph(getItemValue(sensorName, 0.0)))
+            windgustmph = str(ms_to_mph(float_sensors[sensorName]()))
 
         windgustdir = None
         sensorName = getTheSensor('windgustdir')
         if sensorName is not None:
-            windgustdir = str(getItemValue(sensorName, 0))
+            windgustdir = str(int_sensors[sensorName]())
 
         windspdmph_avg2m = None
         sensorName = getTheSensor('windspeedms_avg2m')
         if sensorName is not None:
-            windspdmph_avg2m = str(ms_to_mph(getItemValue(sensorName, 0.0)))
+            windspdmph_avg2m = str(ms_to_mph(float_sensors[sensorName]()))
 
         winddir_avg2m = None
         sensorName = getTheSensor('winddir_avg2m')
         if sensorName is not None:
-            winddir_avg2m = str(getItemValue(sensorName, 0))
+            winddir_avg2m = str(int_sensors[sensorName]())
 
         windgustmph_10m = None
         sensorName = getTheSensor('windgustms_10m')
         if sensorName is not None:
-            windgustmph_10m = str(ms_to_mph(getItemValue(sensorName, 0.0)))
+            windgustmph_10m = str(ms_to_mph(float_sensors[sensorName]()))
 
         windgustdir_10m = None
         sensorName = getTheSensor('windgustdir_10m')
         if sensorName is not None:
-            windgustdir_10m = str(getItemValue(sensorName, 0))
+            windgustdir_10m = str(int_sensors[sensorName]())
 
         solarradiation = None
         sensorName = getTheSensor('solarradiation', getHighest=True)
         if sensorName is not None:
-            solarradiation = str(lux_to_watts_m2(getItemValue(sensorName, 0)))
+            solarradiation = str(lux_to_watts_m2(int_sensors[sensorName]()))
 
         # From http://wiki.wunderground.com/index.php/PWS_-_Upload_Protocol
 
@@ -74,8 +74,7 @@ from org.joda.time import DateTime
 from core.jsr223 import scope
 from core.date import format_date
 from core.log import logging, LOG_PREFIX
-from core.utils import getItemValue, post_update_if_different, send_command_if_different, kw
-from core.actions import PersistenceExtensions
+from core.utils import getItemValue, post_update_if_different, post_updates_if_different, send_commands_if_different, buffered_updates, last_update, kw
 from configuration import idealarm_configuration, customDateTimeFormats, customGroupNames
 from personal.idealarm import custom
 
@@ -144,12 +143,11 @@ class IdeAlarmSensor(object):
         Returns the sensors last update time (if available).
         type is 'org.joda.time.DateTime', http://joda-time.sourceforge.net/apidocs/org/joda/time/DateTime.html
         '''
-        try:
-            lastUpdate = PersistenceExtensions.lastUpdate(scope.itemRegistry.getItem(self.name)).toDateTime()
-        except:
-            lastUpdate = DateTime(0)
+        millis = last_update(self.name)
+        if not millis:
             self.log.info(u"Could not retrieve persistence data for sensor: {}".format(self.name.decode('utf8')))
-        return lastUpdate
+            return DateTime(0)
+        return DateTime(millis)
 
 class IdeAlarmZone(object):
     '''
@@ -259,13 +257,14 @@ class IdeAlarmZone(object):
         if newZoneStatus in [ZONESTATUS['NORMAL']]:
 
             # Cancel all timers so they won't fire
-            post_update_if_different("Z{}_Entry_Timer".format(self.zoneNumber), scope.OFF)
-            post_update_if_different("Z{}_Exit_Timer".format(self.zoneNumber), scope.OFF)
-            post_update_if_different("Z{}_Alert_Max_Timer".format(self.zoneNumber), scope.OFF)
+            post_updates_if_different({
+                "Z{}_Entry_Timer".format(self.zoneNumber): scope.OFF,
+                "Z{}_Exit_Timer".format(self.zoneNumber): scope.OFF,
+                "Z{}_Alert_Max_Timer".format(self.zoneNumber): scope.OFF
+            })
 
             # Cancel sirens
-            for alertDevice in self.alertDevices:
-                send_command_if_different(alertDevice, scope.OFF)
+            send_commands_if_different(dict((alertDevice, scope.OFF) for alertDevice in self.alertDevices))
 
         # Sync the Zone Status Item
         post_update_if_different(self.statusItem, newZoneStatus, sendCommand)
@@ -338,8 +337,7 @@ class IdeAlarmZone(object):
 
         # We need to make some noise here!
         if not self.alarmTestMode:
-            for alertDevice in self.alertDevices:
-                send_command_if_different(alertDevice, scope.ON)
+            send_commands_if_different(dict((alertDevice, scope.ON) for alertDevice in self.alertDevices))
             self.log.info('You should be able to hear the sirens now...')
         else:
             self.log.info('ALARM_TEST_MODE is activated. No sirens!')
@@ -352,13 +350,15 @@ class IdeAlarmZone(object):
         '''
         self.setArmingMode(ARMINGMODE['ARMED_AWAY'])
 
+    @buffered_updates
     def onAlertMaxTimer(self):
         '''
-        Called after the sirens (or whatever alert devices you use) have reached their time limit
+        Called after the sirens (or whatever alert devices you use) have reached their time limit.
+        The sirens are also switched off by the automatic reset, so the commands are buffered
+        and each alert device is only sent one command.
         '''
         # Cancel alert devices, e.g. the sirens
-        for alertDevice in self.alertDevices:
-            send_command_if_different(alertDevice, scope.OFF)
+        send_commands_if_different(dict((alertDevice, scope.OFF) for alertDevice in self.alertDevices))
         self.log.debug('Alert devices have been switched off due to they\'ve reached their time limit')
 
         if self.autoResetAfterAlert == True:
@@ -17,16 +17,19 @@ this module can accept any of the following date types:
 __all__ = [
     "format_date", "days_between", "hours_between", "minutes_between",
     "seconds_between", "to_java_zoneddatetime", "to_java_calendar",
-    "to_python_datetime", "to_joda_datetime", "human_readable_seconds"
+    "to_python_datetime", "to_joda_datetime", "human_readable_seconds",
+    "human_readable_seconds_list",
+    "to_epoch_millis", "millis_between", "millis_since"
 ]
 
 import sys
 import datetime
 
-from java.time import LocalDateTime, ZonedDateTime
+from java.time import Instant, LocalDateTime, ZonedDateTime
 from java.time import ZoneId, ZoneOffset
 from java.time.format import DateTimeFormatter
-from java.time.temporal.ChronoUnit import DAYS, HOURS, MINUTES, SECONDS
+from java.time.temporal.ChronoUnit import DAYS
+from java.lang import System
 from java.util import Calendar, Date, TimeZone
 from org.joda.time import DateTime, DateTimeZone
 
@@ -50,32 +53,65 @@ try:
 except:
     LEGACY_DATETIME = None
 
-
-def format_date(value, format_string="yyyy-MM-dd'T'HH:mm:ss.SSxx"):
+# the system default timezone is looked up once, since openHAB sets it at
+# startup
+_SYSTEM_ZONE = ZoneId.systemDefault()
+# {offset in seconds: ZoneId}, {TimeZone ID: ZoneId}, {Joda DateTimeZone:
+# ZoneId} and {ZoneId: Joda DateTimeZone}. These are all immutable, so they can
+# be shared.
+_OFFSET_ZONES = {}
+_TIMEZONE_ZONES = {}
+_JODA_TO_ZONES = {}
+_ZONES_TO_JODA = {}
+# {type: converter}, filled as types are seen, so that each type only goes
+# through the isinstance checks of _TO_ZONEDDATETIME once
+_TO_ZONEDDATETIME_BY_TYPE = {}
+# {type: extractor}, the same for _TO_EPOCH_MILLIS and _TO_EPOCH_NANOS
+_TO_EPOCH_MILLIS_BY_TYPE = {}
+_TO_EPOCH_NANOS_BY_TYPE = {}
+
+_DEFAULT_FORMAT = "yyyy-MM-dd'T'HH:mm:ss.SSxx"
+# {(format string, Locale or None): DateTimeFormatter}
+_FORMATTERS = {(_DEFAULT_FORMAT, None): DateTimeFormatter.ofPattern(_DEFAULT_FORMAT)}
+
+
+def format_date(value, format_string=_DEFAULT_FORMAT, locale=None):
     """
     Returns string of ``value`` formatted according to ``format_string``.
 
     This function can be used when updating Items in openHAB or to format any
     date value for output. The default format string follows the same ISO8601
     format used in openHAB. If ``value`` does not have timezone information,
-    the system default will be used.
+    the system default will be used. The formatter for each format string and
+    locale is only created once.
 
     Examples:
         .. code-block::
 
             events.sendCommand("date_item", format_date(date_value))
             log.info("The time is currently: {}".format(format_date(ZonedDateTime.now())))
+            log.info("Today is {}".format(format_date(ZonedDateTime.now(), "EEEE", Locale.GERMAN)))
 
     Args:
         value: the value to convert
         format_string (str): the pattern to format ``value`` with.
             See `java.time.format.DateTimeFormatter <https://docs.oracle.com/javase/8/docs/api/java/time/format/DateTimeFormatter.html>`_
             for format string tokens.
+        locale (java.util.Locale): (optional) the locale to format ``value``
+            with, defaults to the system default locale
 
     Returns:
         str: the converted value
     """
-    return to_java_zoneddatetime(value).format(DateTimeFormatter.ofPattern(format_string))
+    formatter = _FORMATTERS.get((format_string, locale))
+    if formatter is None:
+        if locale is None:
+            formatter = DateTimeFormatter.ofPattern(format_string)
+        else:
+            formatter = DateTimeFormatter.ofPattern(format_string, locale)
+        # DateTimeFormatter is immutable and thread safe, so it can be shared
+        formatter = _FORMATTERS.setdefault((format_string, locale), formatter)
+    return to_java_zoneddatetime(value).format(formatter)
 
 
 def days_between(start_time, stop_time, calendar_days=False):
@@ -120,7 +156,7 @@ def hours_between(start_time, stop_time):
     Returns:
         int: the number of hours between ``start_time`` and ``stop_time``
     """
-    return HOURS.between(to_java_zoneddatetime(start_time), to_java_zoneddatetime(stop_time))
+    return _time_between(start_time, stop_time, 3600000)
 
 
 def minutes_between(start_time, stop_time):
@@ -140,7 +176,7 @@ def minutes_between(start_time, stop_time):
     Returns:
         int: the number of minutes between ``start_time`` and ``stop_time``
     """
-    return MINUTES.between(to_java_zoneddatetime(start_time), to_java_zoneddatetime(stop_time))
+    return _time_between(start_time, stop_time, 60000)
 
 
 def seconds_between(start_time, stop_time):
@@ -160,7 +196,97 @@ def seconds_between(start_time, stop_time):
     Returns:
         int: the number of seconds between ``start_time`` and ``stop_time``
     """
-    return SECONDS.between(to_java_zoneddatetime(start_time), to_java_zoneddatetime(stop_time))
+    return _time_between(start_time, stop_time, 1000)
+
+
+def _time_between(start_time, stop_time, unit_millis):
+    # compared in nanoseconds and truncated toward zero, like
+    # ChronoUnit.between, so that types with sub-millisecond precision give
+    # the same results as before
+    delta = _to_epoch_nanos(stop_time) - _to_epoch_nanos(start_time)
+    unit_nanos = unit_millis * 1000000
+    if delta >= 0:
+        return delta // unit_nanos
+    return -(-delta // unit_nanos)
+
+
+def _to_epoch_nanos(value):
+    try:
+        extractor = _TO_EPOCH_NANOS_BY_TYPE[type(value)]
+    except KeyError:
+        extractor = _resolve_converter(_TO_EPOCH_NANOS, _TO_EPOCH_NANOS_BY_TYPE, value)
+    return extractor(value)
+
+
+def to_epoch_millis(value):
+    """
+    Converts any of the supported date types to the number of milliseconds
+    since 1970-01-01T00:00:00Z. An int or long is taken to already be in epoch
+    milliseconds and is returned as is. If ``value`` does not have timezone
+    information, the system default will be used.
+
+    Examples:
+        .. code-block::
+
+            millis = to_epoch_millis(items["date_item"])
+
+    Args:
+        value: the value to convert
+
+    Returns:
+        long: the number of milliseconds since the epoch
+
+    Raises:
+        TypeError: if the type of ``value`` is not supported by this module
+    """
+    try:
+        extractor = _TO_EPOCH_MILLIS_BY_TYPE[type(value)]
+    except KeyError:
+        extractor = _resolve_converter(_TO_EPOCH_MILLIS, _TO_EPOCH_MILLIS_BY_TYPE, value)
+    return extractor(value)
+
+
+def millis_between(start_time, stop_time):
+    """
+    Returns the number of milliseconds between ``start_time`` and
+    ``stop_time``. Will return a negative number if ``start_time`` is after
+    ``stop_time``. Both values can be any of the supported date types or
+    epoch milliseconds.
+
+    Examples:
+        .. code-block::
+
+            span_millis = millis_between(items["date_item"], ZonedDateTime.now())
+
+    Args:
+        start_time: value to start from
+        stop_time: value to measure to
+
+    Returns:
+        long: the number of milliseconds between ``start_time`` and
+        ``stop_time``
+    """
+    return to_epoch_millis(stop_time) - to_epoch_millis(start_time)
+
+
+def millis_since(value):
+    """
+    Returns the number of milliseconds from ``value`` until now. Will return
+    a negative number if ``value`` is in the future.
+
+    Examples:
+        .. code-block::
+
+            if millis_since(items["Motion_Last_Seen"]) > 15 * 60 * 1000:
+                events.sendCommand("Hallway_Light", "OFF")
+
+    Args:
+        value: any of the supported date types or epoch milliseconds
+
+    Returns:
+        long: the number of milliseconds since ``value``
+    """
+    return System.currentTimeMillis() - to_epoch_millis(value)
 
 
 def human_readable_seconds(seconds):
@@ -182,29 +308,66 @@ def human_readable_seconds(seconds):
         seconds``
     """
     seconds = int(round(seconds))
-    number_of_days = seconds//86400
-    number_of_hours = (seconds%86400)//3600
-    number_of_minutes = (seconds%3600)//60
-    number_of_seconds = (seconds%3600)%60
-
-    days_string = "{} day{}".format(number_of_days, "s" if number_of_days > 1 else "")
-    hours_string = "{} hour{}".format(number_of_hours, "s" if number_of_hours > 1 else "")
-    minutes_string = "{} minute{}".format(number_of_minutes, "s" if number_of_minutes > 1 else "")
-    seconds_string = "{} second{}".format(number_of_seconds, "s" if number_of_seconds > 1 else "")
-
-    return "{}{}{}{}{}{}{}".format(
-        days_string if number_of_days > 0 else "",
-        "" if number_of_days == 0 or (number_of_hours == 0 and number_of_minutes == 0) else (
-            " and " if (number_of_hours > 0 and number_of_minutes == 0 and number_of_seconds == 0) or (number_of_hours == 0 and number_of_minutes > 0 and number_of_seconds == 0) else ", "
-        ),
-        hours_string if number_of_hours > 0 else "",
-        "" if number_of_hours == 0 or number_of_minutes == 0 else (
-            " and " if number_of_minutes > 0 and number_of_seconds == 0 else ", "
-        ),
-        minutes_string if number_of_minutes > 0 else "",
-        " and " if number_of_seconds > 0 and (number_of_minutes > 0 or number_of_hours > 0 or number_of_days > 0) else "",
-        seconds_string if number_of_seconds > 0 else ""
-    )
+    number_of_days, remainder = divmod(seconds, 86400)
+    number_of_hours, remainder = divmod(remainder, 3600)
+    number_of_minutes, number_of_seconds = divmod(remainder, 60)
+
+    parts = []
+    if number_of_days > 0:
+        parts.append(_DAY_STRINGS[number_of_days] if number_of_days < len(_DAY_STRINGS) else "{} days".format(number_of_days))
+    if number_of_hours:
+        parts.append(_HOUR_STRINGS[number_of_hours])
+    if number_of_minutes:
+        parts.append(_MINUTE_STRINGS[number_of_minutes])
+    if number_of_seconds:
+        parts.append(_SECOND_STRINGS[number_of_seconds])
+    if len(parts) > 1:
+        text = ", ".join(parts[:-1]) + " and " + parts[-1]
+    else:
+        text = parts[0] if parts else ""
+    if number_of_days < 0 and (number_of_hours or number_of_minutes):
+        # negative durations have always been formatted with a leading
+        # separator in place of the days
+        text = (" and " if len(parts) == 1 else ", ") + text
+    return text
+
+
+def human_readable_seconds_list(seconds_list):
+    """
+    Does the same as ``human_readable_seconds`` for many durations at once,
+    formatting each distinct duration only once.
+
+    Examples:
+        .. code-block::
+
+            messages = human_readable_seconds_list([55555, 60, 60])
+            # ["15 hours, 25 minutes and 55 seconds", "1 minute", "1 minute"]
+
+    Args:
+        seconds_list (list): the numbers of seconds
+
+    Returns:
+        list: the formatted strings, in the same order as ``seconds_list``
+    """
+    formatted = {}
+    result = []
+    for seconds in seconds_list:
+        text = formatted.get(seconds)
+        if text is None:
+            text = formatted[seconds] = human_readable_seconds(seconds)
+        result.append(text)
+    return result
+
+
+def _unit_strings(unit, count):
+    return ["{} {}{}".format(number, unit, "s" if number > 1 else "") for number in range(count)]
+
+
+# preformatted strings for the counts of each unit, indexed by the count
+_DAY_STRINGS = _unit_strings("day", 366)
+_HOUR_STRINGS = _unit_strings("hour", 24)
+_MINUTE_STRINGS = _unit_strings("minute", 60)
+_SECOND_STRINGS = _unit_strings("second", 60)
 
 
 def to_java_zoneddatetime(value):
@@ -227,45 +390,144 @@ def to_java_zoneddatetime(value):
     Raises:
         TypeError: if the type of ``value`` is not supported by this module
     """
-    if isinstance(value, ZonedDateTime):
-        return value
-    timezone_id = ZoneId.systemDefault()
-    # java.time.LocalDateTime
-    if isinstance(value, LocalDateTime):
-        return value.atZone(timezone_id)
-    # python datetime
-    if isinstance(value, datetime.datetime):
-        if value.tzinfo is not None:
-            timezone_id = ZoneId.ofOffset("GMT", ZoneOffset.ofTotalSeconds(int(value.utcoffset().total_seconds())))
-        return ZonedDateTime.of(
-            value.year,
-            value.month,
-            value.day,
-            value.hour,
-            value.minute,
-            value.second,
-            value.microsecond * 1000,
-            timezone_id
-        )
-    # java.util.Calendar
-    if isinstance(value, Calendar):
-        return ZonedDateTime.ofInstant(value.toInstant(), ZoneId.of(value.getTimeZone().getID()))
-    # java.util.Date
-    if isinstance(value, Date):
-        return ZonedDateTime.ofInstant(value.toInstant(), ZoneId.ofOffset("GMT", ZoneOffset.ofHours(0 - value.getTimezoneOffset() / 60)))
-    # Joda DateTime
-    if isinstance(value, DateTime):
-        return value.toGregorianCalendar().toZonedDateTime()
-    # openHAB DateTimeType
-    if EclipseDateTime and isinstance(value, EclipseDateTime):
-        return to_java_zoneddatetime(value.calendar)
-    # openHAB 1.x DateTimeType
-    if LEGACY_DATETIME and isinstance(value, LEGACY_DATETIME):
-        return to_java_zoneddatetime(value.calendar)
+    try:
+        converter = _TO_ZONEDDATETIME_BY_TYPE[type(value)]
+    except KeyError:
+        converter = _resolve_converter(_TO_ZONEDDATETIME, _TO_ZONEDDATETIME_BY_TYPE, value)
+    return converter(value)
 
+
+def _resolve_converter(converters, converters_by_type, value):
+    """
+    Finds the converter in a list of (type, converter) for the type of
+    ``value`` and remembers it for that type.
+    """
+    for supported_type, converter in converters:
+        if supported_type is not None and isinstance(value, supported_type):
+            converters_by_type[type(value)] = converter
+            return converter
     raise TypeError("Unknown type: {}".format(str(type(value))))
 
 
+def _offset_zone(offset_seconds):
+    zone = _OFFSET_ZONES.get(offset_seconds)
+    if zone is None:
+        zone = _OFFSET_ZONES.setdefault(offset_seconds, ZoneId.ofOffset("GMT", ZoneOffset.ofTotalSeconds(offset_seconds)))
+    return zone
+
+
+def _timezone_zone(timezone):
+    timezone_id = timezone.getID()
+    zone = _TIMEZONE_ZONES.get(timezone_id)
+    if zone is None:
+        zone = _TIMEZONE_ZONES.setdefault(timezone_id, ZoneId.of(timezone_id))
+    return zone
+
+
+def _joda_zone(joda_timezone):
+    zone = _JODA_TO_ZONES.get(joda_timezone)
+    if zone is None:
+        zone = _JODA_TO_ZONES.setdefault(joda_timezone, joda_timezone.toTimeZone().toZoneId())
+    return zone
+
+
+def _zone_to_joda(zone):
+    joda_timezone = _ZONES_TO_JODA.get(zone)
+    if joda_timezone is None:
+        joda_timezone = _ZONES_TO_JODA.setdefault(zone, DateTimeZone.forTimeZone(TimeZone.getTimeZone(zone)))
+    return joda_timezone
+
+
+def _zoneddatetime_from_python(value):
+    timezone_id = _SYSTEM_ZONE if value.tzinfo is None else _offset_zone(int(value.utcoffset().total_seconds()))
+    return ZonedDateTime.of(
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond * 1000,
+        timezone_id
+    )
+
+
+def _zoneddatetime_from_calendar(value):
+    return ZonedDateTime.ofInstant(Instant.ofEpochMilli(value.getTimeInMillis()), _timezone_zone(value.getTimeZone()))
+
+
+def _zoneddatetime_from_date(value):
+    return ZonedDateTime.ofInstant(Instant.ofEpochMilli(value.getTime()), _offset_zone((0 - value.getTimezoneOffset() / 60) * 3600))
+
+
+def _zoneddatetime_from_joda(value):
+    return ZonedDateTime.ofInstant(Instant.ofEpochMilli(value.getMillis()), _joda_zone(value.getZone()))
+
+
+def _zoneddatetime_from_datetimetype(value):
+    return _zoneddatetime_from_calendar(value.calendar)
+
+
+# (type, converter) in the order they are checked. A type is None when it is
+# not available in this version of openHAB.
+_TO_ZONEDDATETIME = [
+    (ZonedDateTime, lambda value: value),
+    (LocalDateTime, lambda value: value.atZone(_SYSTEM_ZONE)),
+    (datetime.datetime, _zoneddatetime_from_python),
+    (Calendar, _zoneddatetime_from_calendar),
+    (Date, _zoneddatetime_from_date),
+    (DateTime, _zoneddatetime_from_joda),
+    (EclipseDateTime, _zoneddatetime_from_datetimetype),
+    (LEGACY_DATETIME, _zoneddatetime_from_datetimetype)
+]
+
+
+def _epoch_millis_from_python(value):
+    if value.tzinfo is None:
+        return _epoch_millis_from_zoneddatetime(_zoneddatetime_from_python(value))
+    delta = value - _PYTHON_EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+
+def _epoch_millis_from_zoneddatetime(value):
+    return value.toEpochSecond() * 1000 + value.getNano() // 1000000
+
+
+def _epoch_nanos_from_python(value):
+    if value.tzinfo is None:
+        return _epoch_nanos_from_zoneddatetime(_zoneddatetime_from_python(value))
+    delta = value - _PYTHON_EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds) * 1000
+
+
+def _epoch_nanos_from_zoneddatetime(value):
+    return value.toEpochSecond() * 1000000000 + value.getNano()
+
+
+# (type, extractor) in the order they are checked
+_TO_EPOCH_MILLIS = [
+    (int, lambda value: value),
+    (long, lambda value: value),
+    (ZonedDateTime, _epoch_millis_from_zoneddatetime),
+    (LocalDateTime, lambda value: _epoch_millis_from_zoneddatetime(value.atZone(_SYSTEM_ZONE))),
+    (datetime.datetime, _epoch_millis_from_python),
+    (Calendar, lambda value: value.getTimeInMillis()),
+    (Date, lambda value: value.getTime()),
+    (DateTime, lambda value: value.getMillis()),
+    (EclipseDateTime, lambda value: value.calendar.getTimeInMillis()),
+    (LEGACY_DATETIME, lambda value: value.calendar.getTimeInMillis())
+]
+
+# (type, extractor) in the order they are checked. Only the types that are
+# more precise than a millisecond have their own extractor.
+_TO_EPOCH_NANOS = [
+    (ZonedDateTime, _epoch_nanos_from_zoneddatetime),
+    (LocalDateTime, lambda value: _epoch_nanos_from_zoneddatetime(value.atZone(_SYSTEM_ZONE))),
+    (datetime.datetime, _epoch_nanos_from_python),
+    (object, lambda value: to_epoch_millis(value) * 1000000)
+]
+
+
 def to_python_datetime(value):
     """
     Converts any of the supported date types to Python ``datetime.datetime``.
@@ -298,31 +560,55 @@ def to_python_datetime(value):
         value_zoneddatetime.getMinute(),
         value_zoneddatetime.getSecond(),
         int(value_zoneddatetime.getNano() / 1000),
-        _pythonTimezone(int(value_zoneddatetime.getOffset().getTotalSeconds() / 60))
+        _python_timezone(int(value_zoneddatetime.getOffset().getTotalSeconds() / 60))
     )
 
 
 class _pythonTimezone(datetime.tzinfo):
+    __slots__ = ["_offset", "_name", "_utcoffset"]
 
     def __init__(self, offset=0, name=""):
         """
-        Python tzinfo with ``offset`` in minutes and name ``name``.
+        Python tzinfo with ``offset`` in minutes and name ``name``. Use
+        ``_python_timezone`` to get a shared instance for an offset.
 
         Args:
             offset (int): Timezone offset from UTC in minutes.
             name (str): Display name of this instance.
         """
-        self.__offset = offset
-        self.__name = name
+        self._offset = offset
+        self._name = name
+        self._utcoffset = datetime.timedelta(minutes=offset)
+
+    def __getinitargs__(self):
+        return (self._offset, self._name)
 
     def utcoffset(self, value):
-        return datetime.timedelta(minutes=self.__offset)
+        return self._utcoffset
 
     def tzname(self, value):
-        return self.__name
+        return self._name
 
     def dst(self, value):
-        return datetime.timedelta(0)
+        return _ZERO_TIMEDELTA
+
+
+_ZERO_TIMEDELTA = datetime.timedelta(0)
+# {offset in minutes: _pythonTimezone}
+_PYTHON_TIMEZONES = {}
+
+
+def _python_timezone(offset):
+    """
+    Returns the shared ``_pythonTimezone`` for ``offset`` minutes from UTC.
+    """
+    timezone = _PYTHON_TIMEZONES.get(offset)
+    if timezone is None:
+        timezone = _PYTHON_TIMEZONES.setdefault(offset, _pythonTimezone(offset))
+    return timezone
+
+
+_PYTHON_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_pythonTimezone(0, "UTC"))
 
 
 def to_joda_datetime(value):
@@ -349,9 +635,7 @@ def to_joda_datetime(value):
         return value
 
     value_zoneddatetime = to_java_zoneddatetime(value)
-    return DateTime(value_zoneddatetime.toInstant().toEpochMilli(),
-        DateTimeZone.forTimeZone(TimeZone.getTimeZone(value_zoneddatetime.getZone()))
-    )
+    return DateTime(value_zoneddatetime.toInstant().toEpochMilli(), _zone_to_joda(value_zoneddatetime.getZone()))
 
 
 def to_java_calendar(value):
@@ -379,11 +663,5 @@ def to_java_calendar(value):
 
     value_zoneddatetime = to_java_zoneddatetime(value)
     new_calendar = Calendar.getInstance(TimeZone.getTimeZone(value_zoneddatetime.getZone().getId()))
-    new_calendar.set(Calendar.YEAR, value_zoneddatetime.getYear())
-    new_calendar.set(Calendar.MONTH, value_zoneddatetime.getMonthValue() - 1)
-    new_calendar.set(Calendar.DAY_OF_MONTH, value_zoneddatetime.getDayOfMonth())
-    new_calendar.set(Calendar.HOUR_OF_DAY, value_zoneddatetime.getHour())
-    new_calendar.set(Calendar.MINUTE, value_zoneddatetime.getMinute())
-    new_calendar.set(Calendar.SECOND, value_zoneddatetime.getSecond())
-    new_calendar.set(Calendar.MILLISECOND, int(value_zoneddatetime.getNano() / 1000000))
+    new_calendar.setTimeInMillis(value_zoneddatetime.toInstant().toEpochMilli())
     return new_calendar
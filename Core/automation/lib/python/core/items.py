@@ -1,16 +1,41 @@
 """
 This module allows runtime creation and removal of items. It will also remove
 any links from an Item before it is removed.
+
+Scripts that need a set of Items, Links and metadata to exist can describe
+them in a manifest and call ``apply_manifest``, which only changes what differs
+from the registries:
+
+.. code-block::
+
+    from core.items import apply_manifest
+
+    apply_manifest({
+        "items": [
+            {"item_name": "gWeather", "item_type": "Group", "label": "Weather"},
+            {"item_name": "Weather_Temperature", "item_type": "Number:Temperature", "groups": ["gWeather"], "label": "Temperature [%.1f %unit%]"}
+        ],
+        "links": [
+            ("Weather_Temperature", "openweathermap:weather-and-forecast:api:local:current#temperature")
+        ],
+        "metadata": [
+            ("Weather_Temperature", "expire", {}, "1h,state=UNDEF")
+        ],
+        "remove_items": ["Old_Weather_Temperature"]
+    })
 """
-__all__ = ["add_item", "remove_item"]
+__all__ = ["add_item", "remove_item", "add_items", "remove_items", "apply_manifest"]
+
+import time
 
 from core.jsr223.scope import scriptExtension, itemRegistry
 scriptExtension.importPreset(None)
 
 import core
 from core import osgi
-from core.log import logging, LOG_PREFIX
-from core.links import remove_all_links
+from core.log import LOG_PREFIX, lazy_logger
+from core.links import add_links, remove_links, links_for_item, remove_all_links
+from core.metadata import metadata_batch, set_metadata
 
 ItemBuilderFactory = osgi.get_service(
         "org.openhab.core.items.ItemBuilderFactory"
@@ -24,7 +49,22 @@ ManagedItemProvider = osgi.get_service(
         "org.eclipse.smarthome.core.items.ManagedItemProvider"
     )
 
-log = logging.getLogger("{}.core.items".format(LOG_PREFIX))
+log = lazy_logger("{}.core.items".format(LOG_PREFIX))
+
+def _build_item(item_name, item_type=None, category=None, groups=None, label=None, tags=None, gi_base_type=None, group_function=None):
+    if item_type is None:
+        raise TypeError("Must provide item_type when creating an Item by name")
+
+    base_item = None if item_type != "Group" or gi_base_type is None else ItemBuilderFactory.newItemBuilder(gi_base_type, item_name + "_baseItem").build()
+    group_function = None if item_type != "Group" else group_function
+    return ItemBuilderFactory.newItemBuilder(item_type, item_name)\
+                                            .withCategory(category)\
+                                            .withGroups(groups)\
+                                            .withLabel(label)\
+                                            .withBaseItem(base_item)\
+                                            .withGroupFunction(group_function)\
+                                            .withTags(set(tags or []))\
+                                            .build()
 
 def add_item(item_or_item_name, item_type=None, category=None, groups=None, label=None, tags=[], gi_base_type=None, group_function=None):
     """
@@ -55,23 +95,10 @@ def add_item(item_or_item_name, item_type=None, category=None, groups=None, labe
             raise TypeError("\"{}\" is not a string or Item".format(item_or_item_name))
         item = item_or_item_name
         if isinstance(item_or_item_name, basestring):
-            item_name = item_or_item_name
-            if item_type is None:
-                raise TypeError("Must provide item_type when creating an Item by name")
-
-            base_item = None if item_type != "Group" or gi_base_type is None else ItemBuilderFactory.newItemBuilder(gi_base_type, item_name + "_baseItem").build()
-            group_function = None if item_type != "Group" else group_function
-            item = ItemBuilderFactory.newItemBuilder(item_type, item_name)\
-                                                    .withCategory(category)\
-                                                    .withGroups(groups)\
-                                                    .withLabel(label)\
-                                                    .withBaseItem(base_item)\
-                                                    .withGroupFunction(group_function)\
-                                                    .withTags(set(tags))\
-                                                    .build()
+            item = _build_item(item_or_item_name, item_type, category, groups, label, tags, gi_base_type, group_function)
 
         ManagedItemProvider.add(item)
-        log.debug("Item added: [{}]".format(item))
+        log.debug("Item added: [{}]", item)
         return item
     except:
         import traceback
@@ -92,17 +119,221 @@ def remove_item(item_or_item_name):
     try:
         item = remove_all_links(item_or_item_name)
         if item is None:
-            log.warn("Item cannot be removed because it does not exist in the ItemRegistry: [{}]".format(item_or_item_name))
+            log.warn("Item cannot be removed because it does not exist in the ItemRegistry: [{}]", item_or_item_name)
             return None
 
         ManagedItemProvider.remove(item.name)
         if itemRegistry.getItems(item.name) == []:
-            log.debug("Item removed: [{}]".format(item.name))
+            log.debug("Item removed: [{}]", item.name)
             return item
         else:
-            log.warn("Failed to remove Item from the ItemRegistry: [{}]".format(item.name))
+            log.warn("Failed to remove Item from the ItemRegistry: [{}]", item.name)
             return None
     except:
         import traceback
         log.error(traceback.format_exc())
         return None
+
+def add_items(items):
+    """
+    Adds many Items using a ManagedItemProvider. The ItemRegistry is scanned
+    once to find the Items that already exist, which are skipped, so this is
+    much faster than calling ``add_item`` for each Item. The counts and the
+    time taken are logged.
+
+    Examples:
+        .. code-block::
+
+            add_items([
+                {"item_name": "gWeather", "item_type": "Group", "label": "Weather"},
+                {"item_name": "Weather_Temperature", "item_type": "Number:Temperature", "groups": ["gWeather"]}
+            ])
+
+    Args:
+        items (list): a list of Items, or of dicts containing an
+            ``item_name`` and the other keyword arguments of ``add_item``
+
+    Returns:
+        list: the Items that were added
+    """
+    start_time = time.time()
+    existing = set(item.name for item in itemRegistry.getItems())
+    added, skipped, failed = _add_items(items, existing)
+    log.debug("Items added: {} added, {} already existed, {} failed, {:.3f}s", len(added), skipped, failed, time.time() - start_time)
+    return added
+
+def _add_items(items, existing):
+    added = []
+    skipped = 0
+    failed = 0
+    for item_or_spec in items:
+        try:
+            item_name = item_or_spec.name if hasattr(item_or_spec, 'name') else item_or_spec["item_name"]
+            if item_name in existing:
+                skipped += 1
+                continue
+            # only the Items that will be added are built
+            item = item_or_spec if hasattr(item_or_spec, 'name') else _build_item(**item_or_spec)
+            ManagedItemProvider.add(item)
+            existing.add(item.name)
+            added.append(item)
+        except:
+            import traceback
+            log.error(traceback.format_exc())
+            failed += 1
+    return added, skipped, failed
+
+def remove_items(items_or_item_names):
+    """
+    Removes many Items and their Links using a ManagedItemProvider. The
+    ItemRegistry is scanned once before and once after the removal, instead
+    of checking each Item separately, so this is much faster than calling
+    ``remove_item`` for each Item. The counts and the time taken are logged.
+
+    Args:
+        items_or_item_names (list): a list of Items or Item names to remove
+
+    Returns:
+        list: the Items that were removed
+    """
+    start_time = time.time()
+    existing = dict((item.name, item) for item in itemRegistry.getItems())
+    to_remove = []
+    missing = 0
+    for item_or_item_name in items_or_item_names:
+        item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+        if item_name in existing:
+            to_remove.append(existing.pop(item_name))
+        else:
+            missing += 1
+    for item in to_remove:
+        try:
+            remove_links(links_for_item(item.name))
+            ManagedItemProvider.remove(item.name)
+        except:
+            import traceback
+            log.error(traceback.format_exc())
+    remaining = set(item.name for item in itemRegistry.getItems())
+    removed = [item for item in to_remove if item.name not in remaining]
+    if len(removed) != len(to_remove):
+        log.warn("Failed to remove Items from the ItemRegistry: {}", [item.name for item in to_remove if item.name in remaining])
+    log.debug("Items removed: {} removed, {} did not exist, {} failed, {:.3f}s", len(removed), missing, len(to_remove) - len(removed), time.time() - start_time)
+    return removed
+
+_SPEC_KEYS = frozenset(["item_name", "item_type", "category", "groups", "label", "tags", "gi_base_type", "group_function"])
+
+def _validate_manifest(manifest):
+    for spec in manifest.get("items", []):
+        if not isinstance(spec, dict) or "item_name" not in spec or "item_type" not in spec:
+            raise ValueError("Manifest Items must be dicts with an item_name and an item_type: [{}]".format(spec))
+        unknown = set(spec.keys()) - _SPEC_KEYS
+        if unknown:
+            raise ValueError("Manifest Item [{}] has unknown keys: {}".format(spec["item_name"], sorted(unknown)))
+    for link in manifest.get("links", []):
+        if len(link) != 2:
+            raise ValueError("Manifest Links must be (item name, channel UID) pairs: [{}]".format(link))
+    for entry in manifest.get("metadata", []):
+        if len(entry) not in (3, 4):
+            raise ValueError("Manifest metadata must be (item name, namespace, configuration[, value]) tuples: [{}]".format(entry))
+
+def _group_function_differs(function, group_function):
+    if function is None:
+        return True
+    return (function.getClass() != group_function.getClass()
+            or list(function.parameters or []) != list(group_function.parameters or []))
+
+def _item_differs(item, spec):
+    if item.type != spec["item_type"]:
+        return True
+    if item.type == "Group":
+        base_type = item.baseItem.type if item.baseItem is not None else None
+        if base_type != spec.get("gi_base_type"):
+            return True
+        if spec.get("group_function") is not None and _group_function_differs(item.function, spec["group_function"]):
+            return True
+    return (item.label != spec.get("label")
+            or item.category != spec.get("category")
+            or set(item.groupNames) != set(spec.get("groups") or [])
+            or set(item.tags) != set(spec.get("tags") or []))
+
+def apply_manifest(manifest):
+    """
+    Makes the ItemRegistry, ItemChannelLinkRegistry and MetadataRegistry
+    match a declarative manifest. The ItemRegistry is read once, Links are
+    checked against the index in ``core.links`` and only the differences are
+    applied, so applying a manifest that is already in place does not change
+    anything. This makes it cheap to apply a manifest every time a script is
+    loaded.
+
+    The manifest is a dict with the following optional keys:
+
+    * **items** - a list of dicts containing an ``item_name`` and the other
+      keyword arguments of ``add_item``. Missing Items are added. Existing
+      Items with a different type, label, category, groups, tags, group
+      base type or group function are replaced by an update.
+    * **links** - a list of ``(item name, channel UID)`` pairs. Missing Links
+      are added, and the Links of the Items in **items** that are not in this
+      list are removed.
+    * **metadata** - a list of ``(item name, namespace, configuration)`` or
+      ``(item name, namespace, configuration, value)`` tuples. Each namespace
+      is set to exactly this ``configuration`` and ``value``, with one
+      registry update for the namespaces that differ.
+    * **remove_items** - a list of names of Items to remove, if they exist.
+
+    Args:
+        manifest (dict): the manifest to apply
+
+    Returns:
+        dict: the number of Items ``added``, ``updated`` and ``removed``, the
+        number of Items that differ but are ``unmanaged`` (e.g. defined in
+        ``.items`` files) and so cannot be updated, and the number of
+        ``links_added`` and ``links_removed``
+
+    Raises:
+        ValueError: if an entry of the manifest is malformed, in which case
+            nothing is changed
+    """
+    start_time = time.time()
+    _validate_manifest(manifest)
+    existing = dict((item.name, item) for item in itemRegistry.getItems())
+    to_add = []
+    updated = 0
+    unmanaged = []
+    for spec in manifest.get("items", []):
+        item = existing.get(spec["item_name"])
+        if item is None:
+            to_add.append(spec)
+        elif _item_differs(item, spec):
+            try:
+                if ManagedItemProvider.update(_build_item(**spec)) is None:
+                    # the Item is not provided by the ManagedItemProvider
+                    unmanaged.append(spec["item_name"])
+                    continue
+                updated += 1
+                log.debug("Item updated: [{}]", spec["item_name"])
+            except:
+                import traceback
+                log.error(traceback.format_exc())
+    added = _add_items(to_add, set(existing.keys()))[0]
+
+    links = [(item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name, str(channel_uid))
+             for item_or_item_name, channel_uid in manifest.get("links", [])]
+    wanted_links = set(links)
+    stale_links = [link for spec in manifest.get("items", []) for link in links_for_item(spec["item_name"]) if link not in wanted_links]
+    links_removed = len(remove_links(stale_links)) if stale_links else 0
+    links_added = len(add_links(links))
+
+    with metadata_batch():
+        for entry in manifest.get("metadata", []):
+            item_name, namespace, configuration = entry[:3]
+            value = entry[3] if len(entry) > 3 else None
+            set_metadata(item_name, namespace, configuration, value, overwrite=True)
+
+    to_remove = [item_name for item_name in manifest.get("remove_items", []) if item_name in existing]
+    removed = remove_items(to_remove) if to_remove else []
+
+    if unmanaged:
+        log.warn("Items differ from the manifest but cannot be updated, since they are not managed Items: {}", unmanaged)
+    result = {"added": len(added), "updated": updated, "unmanaged": len(unmanaged), "removed": len(removed), "links_added": links_added, "links_removed": links_removed}
+    log.debug("Manifest applied: {}, {:.3f}s", result, time.time() - start_time)
+    return result
@@ -1,14 +1,23 @@
 # pylint: disable=wrong-import-position
 """
-This module allows runtime creation and removal of links.
+This module allows runtime creation and removal of links. The Links in the
+ItemChannelLinkRegistry are indexed by Item and by Thing on first use, and the
+index is kept current by a registry listener, so ``links_for_item`` and
+``links_for_thing`` do not scan the registry.
 """
 __all__ = [
     "add_link",
-    "remove_link"
+    "remove_link",
+    "add_links",
+    "remove_links",
+    "links_for_item",
+    "links_for_thing"
 ]
 
+from threading import RLock
+
 from core import osgi
-from core.log import logging, LOG_PREFIX
+from core.log import LOG_PREFIX, lazy_logger
 from core.utils import validate_item, validate_channel_uid
 
 try:
@@ -16,6 +25,16 @@ try:
 except:
     from org.eclipse.smarthome.core.thing.link import ItemChannelLink
 
+try:
+    from org.openhab.core.thing import ChannelUID
+except:
+    from org.eclipse.smarthome.core.thing import ChannelUID
+
+try:
+    from org.openhab.core.common.registry import RegistryChangeListener
+except:
+    from org.eclipse.smarthome.core.common.registry import RegistryChangeListener
+
 ITEM_CHANNEL_LINK_REGISTRY = osgi.get_service(
         "org.openhab.core.thing.link.ItemChannelLinkRegistry"
     ) or osgi.get_service(
@@ -28,7 +47,105 @@ MANAGED_ITEM_CHANNEL_LINK_PROVIDER = osgi.get_service(
         "org.eclipse.smarthome.core.thing.link.ManagedItemChannelLinkProvider"
     )
 
-LOG = logging.getLogger(u"{}.core.links".format(LOG_PREFIX))
+LOG = lazy_logger(u"{}.core.links".format(LOG_PREFIX))
+
+# {item name: set(channel UIDs)}
+_ITEM_INDEX = {}
+# {thing UID: set((item name, channel UID))}
+_THING_INDEX = {}
+_INDEX_LOCK = RLock()
+_INDEX_LISTENER = []
+
+
+class _LinkRegistryListener(RegistryChangeListener):
+
+    def added(self, element):
+        _index_add(element)
+
+    def removed(self, element):
+        _index_remove(element)
+
+    def updated(self, old_element, element):
+        _index_remove(old_element)
+        _index_add(element)
+
+
+def _index_add(link):
+    item_name = link.itemName
+    channel_uid = str(link.linkedUID)
+    with _INDEX_LOCK:
+        _ITEM_INDEX.setdefault(item_name, set()).add(channel_uid)
+        _THING_INDEX.setdefault(str(link.linkedUID.thingUID), set()).add((item_name, channel_uid))
+
+
+def _index_remove(link):
+    item_name = link.itemName
+    channel_uid = str(link.linkedUID)
+    thing_uid = str(link.linkedUID.thingUID)
+    with _INDEX_LOCK:
+        channel_uids = _ITEM_INDEX.get(item_name)
+        if channel_uids is not None:
+            channel_uids.discard(channel_uid)
+            if not channel_uids:
+                del _ITEM_INDEX[item_name]
+        links = _THING_INDEX.get(thing_uid)
+        if links is not None:
+            links.discard((item_name, channel_uid))
+            if not links:
+                del _THING_INDEX[thing_uid]
+
+
+def _ensure_index():
+    if _INDEX_LISTENER:
+        return
+    with _INDEX_LOCK:
+        if not _INDEX_LISTENER:
+            listener = _LinkRegistryListener()
+            ITEM_CHANNEL_LINK_REGISTRY.addRegistryChangeListener(listener)
+            for link in ITEM_CHANNEL_LINK_REGISTRY.getAll():
+                _index_add(link)
+            _INDEX_LISTENER.append(listener)
+            LOG.debug(u"Link index created: {} Items, {} Things", len(_ITEM_INDEX), len(_THING_INDEX))
+
+
+def _is_linked(item_name, channel_uid):
+    _ensure_index()
+    with _INDEX_LOCK:
+        return channel_uid in _ITEM_INDEX.get(item_name, ())
+
+
+def links_for_item(item_or_item_name):
+    """
+    This function returns the Links of an Item.
+
+    Args:
+        item_or_item_name (Item or str): the Item object or name
+
+    Returns:
+        list: a list of ``(item name, channel UID)`` tuples, where the
+        channel UID is a string
+    """
+    item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+    _ensure_index()
+    with _INDEX_LOCK:
+        return [(item_name, channel_uid) for channel_uid in _ITEM_INDEX.get(item_name, ())]
+
+
+def links_for_thing(thing_uid):
+    """
+    This function returns the Links to the Channels of a Thing.
+
+    Args:
+        thing_uid (ThingUID or str): the ThingUID or string representation
+            of a ThingUID
+
+    Returns:
+        list: a list of ``(item name, channel UID)`` tuples, where the
+        channel UID is a string
+    """
+    _ensure_index()
+    with _INDEX_LOCK:
+        return list(_THING_INDEX.get(str(thing_uid), ()))
 
 
 def add_link(item_or_item_name, channel_uid_or_string):
@@ -53,7 +170,7 @@ def add_link(item_or_item_name, channel_uid_or_string):
 
         link = ItemChannelLink(item.name, channel_uid)
         MANAGED_ITEM_CHANNEL_LINK_PROVIDER.add(link)
-        LOG.debug(u"Link added: '{}'".format(link))
+        LOG.debug(u"Link added: '{}'", link)
         return item
     except:
         import traceback
@@ -83,7 +200,7 @@ def remove_link(item_or_item_name, channel_uid_or_string):
 
         link = ItemChannelLink(item.name, channel_uid)
         MANAGED_ITEM_CHANNEL_LINK_PROVIDER.remove(str(link))
-        LOG.debug(u"Link removed: '{}'".format(link))
+        LOG.debug(u"Link removed: '{}'", link)
         return item
     except:
         import traceback
@@ -108,13 +225,92 @@ def remove_all_links(item_or_item_name):
         if item is None:
             return None
 
-        channels = ITEM_CHANNEL_LINK_REGISTRY.getBoundChannels(item.name)
-        links = [ItemChannelLink(item.name, channel) for channel in channels]
-        for link in links:
-            MANAGED_ITEM_CHANNEL_LINK_PROVIDER.remove(str(link))
-            LOG.debug(u"Link removed: '{}'".format(link))
+        remove_links(links_for_item(item.name))
         return item
     except:
         import traceback
         LOG.warn(traceback.format_exc())
         return None
+
+
+def add_links(links):
+    """
+    This function adds many Links using a ManagedItemChannelLinkProvider.
+    Links that already exist are skipped using the Link index, and each Item
+    and Channel is only validated once, however many Links use it.
+
+    Examples:
+        .. code-block::
+
+            add_links([("Item_Name_1", "binding:thing-type:thing:channel_1"), ("Item_Name_2", "binding:thing-type:thing:channel_2")])
+
+    Args:
+        links (list): a list, or other iterable, of ``(Item or str,
+            ChannelUID or str)`` tuples
+
+    Returns:
+        list: the ``(item name, channel UID)`` tuples for the Links that were
+        added, where the channel UID is a string
+    """
+    links = list(links)
+    valid_items = {}
+    valid_channels = {}
+    added = []
+    for item_or_item_name, channel_uid_or_string in links:
+        try:
+            item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+            channel_uid = str(channel_uid_or_string)
+            if _is_linked(item_name, channel_uid):
+                continue
+            if item_name not in valid_items:
+                valid_items[item_name] = validate_item(item_or_item_name) is not None
+            if channel_uid not in valid_channels:
+                valid_channels[channel_uid] = validate_channel_uid(channel_uid_or_string) is not None
+            if not (valid_items[item_name] and valid_channels[channel_uid]):
+                continue
+            MANAGED_ITEM_CHANNEL_LINK_PROVIDER.add(ItemChannelLink(item_name, ChannelUID(channel_uid)))
+            added.append((item_name, channel_uid))
+        except:
+            import traceback
+            LOG.warn(traceback.format_exc())
+    LOG.debug(u"Links added: {} of {}", len(added), len(links))
+    return added
+
+
+def remove_links(links):
+    """
+    This function removes many Links using a ManagedItemChannelLinkProvider.
+    Links that do not exist are skipped using the Link index. The Items and
+    Channels are not validated, so Links to Items or Things that no longer
+    exist can also be removed.
+
+    Examples:
+        .. code-block::
+
+            # remove all Links to a Thing
+            remove_links(links_for_thing("binding:thing-type:thing"))
+
+    Args:
+        links (list): a list, or other iterable, of ``(Item or str,
+            ChannelUID or str)`` tuples
+
+    Returns:
+        list: the ``(item name, channel UID)`` tuples for the Links that were
+        removed, where the channel UID is a string
+    """
+    links = list(links)
+    removed = []
+    for item_or_item_name, channel_uid_or_string in links:
+        try:
+            item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+            channel_uid = str(channel_uid_or_string)
+            if not _is_linked(item_name, channel_uid):
+                continue
+            link = ItemChannelLink(item_name, ChannelUID(channel_uid))
+            MANAGED_ITEM_CHANNEL_LINK_PROVIDER.remove(str(link))
+            LOG.debug(u"Link removed: '{}'", link)
+            removed.append((item_name, channel_uid))
+        except:
+            import traceback
+            LOG.warn(traceback.format_exc())
+    return removed
@@ -2,18 +2,29 @@
 This module bridges the `Python standard logging module <https://docs.python.org/2/library/logging.html>`_
 with the slf4j library used by openHAB. The ``configuration`` module provides
 a ``LOG_PREFIX`` variable that is used as the default logger throughout the
-core modules and scripts.
+core modules and scripts. Records are written to slf4j on the thread that logs
+them, unless ``enable_async_logging`` has been called.
 """
 __all__ = [
     "LOG_PREFIX",
     "logging",
-    "log_traceback"
+    "log_traceback",
+    "lazy_logger",
+    "enable_async_logging",
+    "disable_async_logging",
+    "DROP_NEWEST",
+    "DROP_OLDEST",
+    "BLOCK"
 ]
 
 import logging
+import time
 import traceback
 from functools import wraps
+from threading import Event, Thread
 
+from java.util.concurrent import ArrayBlockingQueue, TimeUnit
+from java.util.concurrent.atomic import AtomicLong
 from org.slf4j import Logger, LoggerFactory
 
 try:
@@ -24,24 +35,175 @@ except:
     LoggerFactory.getLogger("{}.core.log".format(LOG_PREFIX)).warn("The 'configuration.py' file is missing from teh python.path!")
 
 
+# {logger name: slf4j Logger}
+_SLF4J_LOGGERS = {}
+# {logger name: LazyLogger}
+_LAZY_LOGGERS = {}
+# how long a LazyLogger uses the enabled levels it has looked up
+_LEVEL_REFRESH_SECONDS = 10
+
+# overflow policies for the asynchronous mode of Slf4jHandler
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+
+def _get_slf4j_logger(logger_name):
+    logger = _SLF4J_LOGGERS.get(logger_name)
+    if logger is None:
+        logger = _SLF4J_LOGGERS.setdefault(logger_name, LoggerFactory.getLogger(logger_name))
+    return logger
+
+
+def _write(logger_name, level, message):
+    logger = _get_slf4j_logger(logger_name)
+    if level == logging.CRITICAL:
+        logger.trace(message)
+    elif level == logging.ERROR:
+        logger.error(message)
+    elif level == logging.DEBUG:
+        logger.debug(message)
+    elif level == logging.WARNING:
+        logger.warn(message)
+    elif level == logging.INFO:
+        logger.info(message)
+
+
 class Slf4jHandler(logging.Handler):
-    def emit(self, record):
-        message = self.format(record)
+    """
+    Passes log records to slf4j. By default, records are written on the
+    thread that logs them. After ``start_async`` is called, records are
+    formatted on the thread that logs them and put on a bounded queue, which
+    is written to slf4j by a background thread, so that the logging thread
+    does not wait for the appenders.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self._queue = None
+        self._overflow = DROP_NEWEST
+        self._stopped = None
+        self._worker = None
+        self._queued = AtomicLong()
+        self._written = AtomicLong()
+        self._dropped = AtomicLong()
+
+    def _entry(self, record):
         logger_name = record.name
         if record.name == "root":
             logger_name = Logger.ROOT_LOGGER_NAME
-        logger = LoggerFactory.getLogger(logger_name)
-        level = record.levelno
-        if level == logging.CRITICAL:
-            logger.trace(message)
-        elif level == logging.ERROR:
-            logger.error(message)
-        elif level == logging.DEBUG:
-            logger.debug(message)
-        elif level == logging.WARNING:
-            logger.warn(message)
-        elif level == logging.INFO:
-            logger.info(message)
+        return (logger_name, record.levelno, self.format(record))
+
+    def handle(self, record):
+        queue = self._queue
+        if queue is None:
+            return logging.Handler.handle(self, record)
+        rv = self.filter(record)
+        if rv:
+            # only formatting needs the handler lock, so that a full queue
+            # with the BLOCK policy does not stall every logging thread
+            self.acquire()
+            try:
+                entry = self._entry(record)
+            except:
+                self.handleError(record)
+                return rv
+            finally:
+                self.release()
+            self._enqueue(queue, entry)
+        return rv
+
+    def emit(self, record):
+        entry = self._entry(record)
+        queue = self._queue
+        if queue is None:
+            _write(*entry)
+        else:
+            self._enqueue(queue, entry)
+
+    def _enqueue(self, queue, entry):
+        if self._overflow == BLOCK:
+            queue.put(entry)
+        elif self._overflow == DROP_OLDEST:
+            while not queue.offer(entry):
+                if queue.poll() is not None:
+                    self._dropped.incrementAndGet()
+        elif not queue.offer(entry):
+            self._dropped.incrementAndGet()
+            return
+        self._queued.incrementAndGet()
+
+    def _drain(self, queue, stopped):
+        while True:
+            entry = queue.poll(250, TimeUnit.MILLISECONDS)
+            if entry is None:
+                if stopped.is_set():
+                    return
+                continue
+            try:
+                _write(*entry)
+                self._written.incrementAndGet()
+            except:
+                self._dropped.incrementAndGet()
+
+    def start_async(self, queue_size=10000, overflow=DROP_NEWEST):
+        """
+        Starts writing records to slf4j from a background thread. If the
+        queue is full, ``overflow`` decides what happens to a new record.
+
+        Args:
+            queue_size (int): (optional) the maximum number of records
+                waiting to be written, defaults to 10000
+            overflow (str): (optional) ``DROP_NEWEST`` (default) to discard
+                the new record, ``DROP_OLDEST`` to discard the oldest queued
+                record, or ``BLOCK`` to wait until there is room
+        """
+        if overflow not in [DROP_NEWEST, DROP_OLDEST, BLOCK]:
+            raise ValueError(u"'{}' is not a valid overflow policy".format(overflow))
+        self.stop_async()
+        self._overflow = overflow
+        queue = ArrayBlockingQueue(queue_size)
+        self._stopped = Event()
+        self._worker = Thread(target=self._drain, args=(queue, self._stopped), name="{}.core.log.Slf4jHandler".format(LOG_PREFIX))
+        self._worker.daemon = True
+        self._worker.start()
+        self._queue = queue
+
+    def stop_async(self, timeout=5):
+        """
+        Writes the queued records and goes back to writing records on the
+        thread that logs them.
+
+        Args:
+            timeout (float): (optional) the maximum number of seconds to wait
+                for the queued records to be written, defaults to 5
+        """
+        if self._worker is None:
+            return
+        queue, self._queue = self._queue, None
+        self._stopped.set()
+        self._worker.join(timeout)
+        if not self._worker.is_alive():
+            # records that were queued while the worker was stopping
+            entry = queue.poll()
+            while entry is not None:
+                _write(*entry)
+                self._written.incrementAndGet()
+                entry = queue.poll()
+        self._worker = None
+
+    def counters(self):
+        """
+        Returns:
+            dict: the number of records that were ``queued``, ``written`` by
+            the background thread and ``dropped`` because the queue was full
+            or they could not be written
+        """
+        return {
+            "queued": self._queued.get(),
+            "written": self._written.get(),
+            "dropped": self._dropped.get()
+        }
 
 
 HANDLER = Slf4jHandler()
@@ -49,6 +211,129 @@ logging.root.setLevel(logging.DEBUG)
 logging.root.handlers = [HANDLER]
 
 
+class LazyLogger(object):
+    """
+    A logger that only formats a message if its level is enabled. The
+    message is a format string for ``str.format`` and the arguments are
+    passed separately, so a disabled level costs a clock read and a
+    dictionary lookup instead of formatting the message. Which levels are
+    enabled, in both the Python logger and slf4j, is looked up again every
+    ``_LEVEL_REFRESH_SECONDS``, so a change to the log configuration takes up
+    to that long to apply. Use ``lazy_logger`` to get an instance.
+
+    Examples:
+        .. code-block::
+
+            LOG = lazy_logger(u"{}.core.example".format(LOG_PREFIX))
+            LOG.debug(u"Item '{}' changed to '{}'", item_name, new_state)
+    """
+    __slots__ = ["name", "_logger", "_slf4j_logger", "_enabled", "_refresh_at"]
+
+    def __init__(self, name):
+        self.name = name
+        self._logger = logging.getLogger(name)
+        self._slf4j_logger = _get_slf4j_logger(Logger.ROOT_LOGGER_NAME if name == "root" else name)
+        self._enabled = {}
+        self._refresh_at = 0
+
+    def isEnabledFor(self, level):
+        """
+        Returns:
+            bool: ``True`` if messages of ``level`` would be logged
+        """
+        now = time.time()
+        if now >= self._refresh_at:
+            slf4j_logger = self._slf4j_logger
+            python_logger = self._logger
+            self._enabled = {
+                logging.CRITICAL: bool(slf4j_logger.isTraceEnabled()) and python_logger.isEnabledFor(logging.CRITICAL),
+                logging.ERROR: bool(slf4j_logger.isErrorEnabled()) and python_logger.isEnabledFor(logging.ERROR),
+                logging.WARNING: bool(slf4j_logger.isWarnEnabled()) and python_logger.isEnabledFor(logging.WARNING),
+                logging.INFO: bool(slf4j_logger.isInfoEnabled()) and python_logger.isEnabledFor(logging.INFO),
+                logging.DEBUG: bool(slf4j_logger.isDebugEnabled()) and python_logger.isEnabledFor(logging.DEBUG)
+            }
+            self._refresh_at = now + _LEVEL_REFRESH_SECONDS
+        return self._enabled.get(level, False)
+
+    def _log(self, level, message, args, kwargs):
+        if self.isEnabledFor(level):
+            if args or kwargs:
+                message = message.format(*args, **kwargs)
+            self._logger.log(level, message)
+
+    def debug(self, message, *args, **kwargs):
+        self._log(logging.DEBUG, message, args, kwargs)
+
+    def info(self, message, *args, **kwargs):
+        self._log(logging.INFO, message, args, kwargs)
+
+    def warning(self, message, *args, **kwargs):
+        self._log(logging.WARNING, message, args, kwargs)
+
+    warn = warning
+
+    def error(self, message, *args, **kwargs):
+        self._log(logging.ERROR, message, args, kwargs)
+
+    def critical(self, message, *args, **kwargs):
+        self._log(logging.CRITICAL, message, args, kwargs)
+
+
+def lazy_logger(name):
+    """
+    Returns the ``LazyLogger`` for ``name``. There is one instance for each
+    name.
+
+    Args:
+        name (str): the name of the logger
+
+    Returns:
+        LazyLogger: the logger
+    """
+    logger = _LAZY_LOGGERS.get(name)
+    if logger is None:
+        logger = _LAZY_LOGGERS.setdefault(name, LazyLogger(name))
+    return logger
+
+
+def enable_async_logging(queue_size=10000, overflow=DROP_NEWEST):
+    """
+    Makes the handler used by all Python loggers write to slf4j from a
+    background thread, so that logging does not wait for the log appenders.
+    Messages are still formatted by the thread that logs them. Records that
+    are still queued when openHAB stops are lost.
+
+    Examples:
+        .. code-block::
+
+            from core.log import enable_async_logging, DROP_OLDEST
+            enable_async_logging(queue_size=5000, overflow=DROP_OLDEST)
+
+    Args:
+        queue_size (int): (optional) the maximum number of records waiting to
+            be written, defaults to 10000
+        overflow (str): (optional) ``DROP_NEWEST`` (default), ``DROP_OLDEST``
+            or ``BLOCK``, see ``Slf4jHandler.start_async``
+
+    Returns:
+        Slf4jHandler: the handler, which provides ``counters()``
+    """
+    HANDLER.start_async(queue_size, overflow)
+    return HANDLER
+
+
+def disable_async_logging(timeout=5):
+    """
+    Writes the queued records and makes the handler used by all Python
+    loggers write to slf4j from the thread that logs again.
+
+    Args:
+        timeout (float): (optional) the maximum number of seconds to wait for
+            the queued records to be written, defaults to 5
+    """
+    HANDLER.stop_async(timeout)
+
+
 def log_traceback(function):
     """
     Decorator to provide better Jython stack traces
@@ -9,17 +9,17 @@ Advanced Examples
 
 --code-block::
 
-    # get a list of Items with a specific namespace
-    from core.metadata import get_metadata
+    # get a list of the names of Items with a specific namespace
+    from core.metadata import items_with_namespace
 
-    items_with_namespace = [item for item in itemRegistry.getAll() if get_metadata(item.name, "area_triggers_and_actions") is not None]
+    item_names = items_with_namespace("area_triggers_and_actions")
 
 --code-block::
 
-    # get a list of Items with a specific namespace and key value
-    from core.metadata import get_key_value
+    # get a list of the names of Items with a specific namespace and key value
+    from core.metadata import items_with_key_value
 
-    items_with_key_value = [item for item in itemRegistry.getAll() if get_key_value(item.name, "area_triggers_and_actions", "light_action", "lux_item_name") == "ESP12E_01_Luminance"]
+    item_names = items_with_key_value("area_triggers_and_actions", ["light_action", "lux_item_name"], "ESP12E_01_Luminance")
 
 --code-block::
 
@@ -36,9 +36,49 @@ Advanced Examples
 
     for item in itemRegistry.getAll():
         remove_metadata(item.name)
+
+--code-block::
+
+    # read a key value in a rule without parsing the path on every call
+    from core.metadata import metadata_path
+
+    LUX_ITEM_NAME = metadata_path("area_triggers_and_actions", "light_action", "lux_item_name")
+
+    def my_rule(event):
+        lux_item_name = LUX_ITEM_NAME.get(event.itemName)
+
+--code-block::
+
+    # make many changes with one registry update per Item and namespace
+    from core.metadata import metadata_batch, set_key_value
+
+    with metadata_batch():
+        for item in itemRegistry.getAll():
+            set_key_value(item.name, "Namespace_Name", "Key", "Subkey", "Value")
+
+--code-block::
+
+    # copy the metadata of some namespaces to another openHAB instance
+    from core.metadata import export_snapshot, import_snapshot
+
+    export_snapshot("/tmp/metadata.snapshot", ["area_triggers_and_actions", "ideAlarm"])
+    # on the other instance...
+    import_snapshot("/tmp/metadata.snapshot", mode="replace")
+
+Caching
+-------
+
+Metadata read through this module is cached, along with its ``configuration``
+converted to Python dicts and lists. The cache and the namespace indexes are
+kept current by a MetadataRegistry listener, so metadata changed outside of
+this module (e.g. in .items files or through the REST API) is not missed.
+Values returned by ``get_key_value`` are shared with the cache and must not be
+modified.
 """
 __all__ = [
     "get_all_namespaces",
+    "items_with_namespace",
+    "items_with_key_value",
     "get_metadata",
     "set_metadata",
     "remove_metadata",
@@ -46,24 +86,281 @@ __all__ = [
     "set_value",
     "get_key_value",
     "set_key_value",
-    "remove_key_value"
+    "remove_key_value",
+    "metadata_batch",
+    "metadata_path",
+    "export_snapshot",
+    "import_snapshot"
 ]
 
+import json
+import struct
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import RLock, local
+
+from java.math import BigDecimal, BigInteger
+from java.util import List, Map
+
 from core import osgi
-from core.log import logging, LOG_PREFIX
+from core.log import LOG_PREFIX, lazy_logger
 
 try:
     from org.openhab.core.items import Metadata, MetadataKey
 except:
     from org.eclipse.smarthome.core.items import Metadata, MetadataKey
 
+try:
+    from org.openhab.core.common.registry import RegistryChangeListener
+except:
+    from org.eclipse.smarthome.core.common.registry import RegistryChangeListener
+
 METADATA_REGISTRY = osgi.get_service(
         "org.openhab.core.items.MetadataRegistry"
     ) or osgi.get_service(
         "org.eclipse.smarthome.core.items.MetadataRegistry"
     )
 
-LOG = logging.getLogger(u"{}.core.metadata".format(LOG_PREFIX))
+LOG = lazy_logger(u"{}.core.metadata".format(LOG_PREFIX))
+
+# {namespace: set(item names)}
+_NAMESPACE_INDEX = {}
+# {item name: set(namespaces)}
+_ITEM_INDEX = {}
+# {namespace: {key path tuple: ({_value_key(value): set(item names)}, [(item name, unhashable value)])}},
+# built on demand by items_with_key_value and dropped for a namespace when it
+# changes
+_VALUE_INDEX = {}
+# {(item name, namespace): (Metadata or None, configuration as Python dict or None)}
+_METADATA_CACHE = {}
+_INDEX_LOCK = RLock()
+_INDEX_LISTENER = []
+# incremented on every change, so that a value index or cache entry read while
+# metadata is changing is not stored
+_INDEX_GENERATION = [0]
+# _BATCH.changes is an OrderedDict of {(item name, namespace): (value,
+# configuration) or None for a removal} while a metadata_batch is in progress
+_BATCH = local()
+
+
+class _MetadataRegistryListener(RegistryChangeListener):
+
+    def added(self, element):
+        _index_add(element.UID.itemName, element.UID.namespace)
+
+    def removed(self, element):
+        _index_remove(element.UID.itemName, element.UID.namespace)
+
+    def updated(self, old_element, element):
+        with _INDEX_LOCK:
+            _INDEX_GENERATION[0] += 1
+            _METADATA_CACHE.pop((element.UID.itemName, element.UID.namespace), None)
+            _VALUE_INDEX.pop(element.UID.namespace, None)
+
+
+def _index_add(item_name, namespace):
+    with _INDEX_LOCK:
+        _INDEX_GENERATION[0] += 1
+        _METADATA_CACHE.pop((item_name, namespace), None)
+        _NAMESPACE_INDEX.setdefault(namespace, set()).add(item_name)
+        _ITEM_INDEX.setdefault(item_name, set()).add(namespace)
+        _VALUE_INDEX.pop(namespace, None)
+
+
+def _index_remove(item_name, namespace):
+    with _INDEX_LOCK:
+        _INDEX_GENERATION[0] += 1
+        _METADATA_CACHE.pop((item_name, namespace), None)
+        item_names = _NAMESPACE_INDEX.get(namespace)
+        if item_names is not None:
+            item_names.discard(item_name)
+            if not item_names:
+                del _NAMESPACE_INDEX[namespace]
+        namespaces = _ITEM_INDEX.get(item_name)
+        if namespaces is not None:
+            namespaces.discard(namespace)
+            if not namespaces:
+                del _ITEM_INDEX[item_name]
+        _VALUE_INDEX.pop(namespace, None)
+
+
+def _ensure_index():
+    """
+    Builds the namespace indexes from the MetadataRegistry on first use. The
+    listener is added before the scan, so that changes made during the scan
+    are not lost.
+    """
+    if _INDEX_LISTENER:
+        return
+    with _INDEX_LOCK:
+        if not _INDEX_LISTENER:
+            listener = _MetadataRegistryListener()
+            METADATA_REGISTRY.addRegistryChangeListener(listener)
+            for metadata in METADATA_REGISTRY.getAll():
+                _index_add(metadata.UID.itemName, metadata.UID.namespace)
+            _INDEX_LISTENER.append(listener)
+            LOG.debug(u"Metadata index created: {} namespaces, {} Items", len(_NAMESPACE_INDEX), len(_ITEM_INDEX))
+
+
+def _to_python_number(value):
+    """
+    Converts a BigDecimal or BigInteger into a long, or into a float if it has
+    a fractional part.
+    """
+    if isinstance(value, BigDecimal):
+        if value.signum() == 0 or value.stripTrailingZeros().scale() <= 0:
+            return long(value.toBigInteger().toString())
+        return value.doubleValue()
+    return long(value.toString())
+
+
+def _to_python(value):
+    """
+    Recursively converts Java Maps and Lists in a ``configuration`` into
+    Python dicts and lists, and Java numbers into longs and floats, so that
+    cached values compare equal to the values written by scripts.
+    """
+    if isinstance(value, (dict, Map)):
+        return dict((key, _to_python(sub_value)) for key, sub_value in value.items())
+    elif isinstance(value, (list, List)):
+        return [_to_python(sub_value) for sub_value in value]
+    elif isinstance(value, (BigDecimal, BigInteger)):
+        return _to_python_number(value)
+    return value
+
+
+def _get_cached(item_name, namespace):
+    """
+    Returns a ``(Metadata, configuration)`` tuple from the cache, reading it
+    from the MetadataRegistry on a miss. Both values are ``None`` if the
+    namespace does not exist for the Item. The configuration is shared with
+    the cache and must not be changed; use ``_detached`` before returning any
+    part of it to a caller.
+    """
+    _ensure_index()
+    key = (item_name, namespace)
+    with _INDEX_LOCK:
+        entry = _METADATA_CACHE.get(key)
+        if entry is not None:
+            return entry
+        generation = _INDEX_GENERATION[0]
+    metadata = METADATA_REGISTRY.get(MetadataKey(namespace, item_name))
+    entry = (metadata, _to_python(metadata.configuration) if metadata is not None else None)
+    with _INDEX_LOCK:
+        if generation == _INDEX_GENERATION[0]:
+            _METADATA_CACHE[key] = entry
+    return entry
+
+
+def _detached(value):
+    """
+    Returns a copy of the dicts and lists in a cached ``configuration`` value,
+    so that callers changing it do not change the cache.
+    """
+    if isinstance(value, dict):
+        return dict((key, _detached(sub_value)) for key, sub_value in value.iteritems())
+    elif isinstance(value, list):
+        return [_detached(sub_value) for sub_value in value]
+    return value
+
+
+def _read(item_name, namespace):
+    """
+    Returns the ``(value, configuration)`` of a namespace, including changes
+    pending in the current batch, or ``None`` if the namespace does not exist.
+    """
+    changes = getattr(_BATCH, "changes", None)
+    if changes is not None and (item_name, namespace) in changes:
+        return changes[(item_name, namespace)]
+    metadata, configuration = _get_cached(item_name, namespace)
+    return (metadata.value, configuration) if metadata is not None else None
+
+
+def _write(item_name, namespace, value, configuration):
+    """
+    Adds or updates a namespace, or removes it if ``configuration`` is
+    ``None``. If a batch is in progress, the change is staged instead.
+    """
+    entry = (value, configuration) if configuration is not None else None
+    changes = getattr(_BATCH, "changes", None)
+    if changes is not None:
+        changes[(item_name, namespace)] = entry
+    else:
+        _apply(item_name, namespace, entry)
+
+
+def _apply(item_name, namespace, entry):
+    key = MetadataKey(namespace, item_name)
+    if entry is None:
+        METADATA_REGISTRY.remove(key)
+    elif _get_cached(item_name, namespace)[0] is None:
+        METADATA_REGISTRY.add(Metadata(key, entry[0], entry[1]))
+    else:
+        METADATA_REGISTRY.update(Metadata(key, entry[0], entry[1]))
+
+
+def _flush(changes):
+    """
+    Applies the changes staged by a batch, skipping those that would not
+    change the registry. If a change fails, the changes already applied are
+    reverted.
+    """
+    applied = []
+    try:
+        for (item_name, namespace), entry in changes.iteritems():
+            original = _read(item_name, namespace)
+            if entry != original:
+                _apply(item_name, namespace, entry)
+                applied.append((item_name, namespace, original))
+    except:
+        LOG.warn(u"metadata_batch: reverting {} applied changes after a failure", len(applied))
+        for item_name, namespace, original in reversed(applied):
+            try:
+                _apply(item_name, namespace, original)
+            except:
+                import traceback
+                LOG.warn(traceback.format_exc())
+        raise
+    LOG.debug(u"metadata_batch: {} changes applied, {} unchanged", len(applied), len(changes) - len(applied))
+
+
+@contextmanager
+def metadata_batch():
+    """
+    This context manager collects the changes made by the functions in this
+    module and applies them when the block exits, with one registry update
+    per Item and namespace. Changes to the same namespace are merged, and
+    changes that leave a namespace as it was are dropped. Reads inside the
+    block see the pending changes, except for ``get_all_namespaces``,
+    ``items_with_namespace`` and ``items_with_key_value``, which only see
+    the registry.
+
+    If the block raises an exception, none of the changes are applied. If
+    applying a change fails, the changes already applied are reverted and the
+    exception is raised. Nested batches are merged into the outermost one.
+    Batches are per thread.
+
+    Examples:
+        .. code-block::
+
+            with metadata_batch():
+                set_key_value("Item_Name", "Namespace_Name", "Key_1", "Value_1")
+                set_key_value("Item_Name", "Namespace_Name", "Key_2", "Value_2")
+                remove_key_value("Item_Name", "Namespace_Name", "Key_3")
+    """
+    if getattr(_BATCH, "changes", None) is not None:
+        yield
+        return
+    _BATCH.changes = OrderedDict()
+    try:
+        yield
+        changes = _BATCH.changes
+    except:
+        LOG.warn(u"metadata_batch: discarding {} changes after an exception", len(_BATCH.changes))
+        raise
+    finally:
+        _BATCH.changes = None
+    _flush(changes)
 
 
 def get_all_namespaces(item_name):
@@ -84,8 +381,116 @@ def get_all_namespaces(item_name):
         list: a list of strings representing the namespace names found for the
         specified Item
     """
-    LOG.debug(u"get_all_namespaces: Item '{}'".format(item_name))
-    return [metadata.UID.namespace for metadata in METADATA_REGISTRY.getAll() if metadata.UID.itemName == item_name]
+    LOG.debug(u"get_all_namespaces: Item '{}'", item_name)
+    _ensure_index()
+    with _INDEX_LOCK:
+        return list(_ITEM_INDEX.get(item_name, ()))
+
+
+def items_with_namespace(namespace):
+    """
+    This function will return a list of the names of the Items that have
+    metadata in the specified namespace. The lookup uses an index that is kept
+    current by MetadataRegistry events, so the registry is not scanned.
+
+    Examples:
+        .. code-block::
+
+            # Get the names of the Items with a namespace
+            items_with_namespace("Namespace_Name")
+
+    Args:
+        namespace (str): name of the namespace
+
+    Returns:
+        list: a list of strings representing the names of the Items that have
+        metadata in the namespace
+    """
+    LOG.debug(u"items_with_namespace: namespace '{}'", namespace)
+    _ensure_index()
+    with _INDEX_LOCK:
+        return list(_NAMESPACE_INDEX.get(namespace, ()))
+
+
+def _value_key(value):
+    """
+    Returns the key for ``value`` in the value index. The kind of value is
+    part of the key, since ``True``, ``1`` and ``1.0`` are equal and have the
+    same hash in Python. ints and longs, and strs and unicodes, are the same
+    kind, since configurations hold longs and unicodes.
+    """
+    if isinstance(value, bool):
+        kind = bool
+    elif isinstance(value, (int, long)):
+        kind = long
+    elif isinstance(value, basestring):
+        kind = basestring
+    else:
+        kind = type(value)
+    return (kind, value)
+
+
+def items_with_key_value(namespace, keys, value):
+    """
+    This function will return a list of the names of the Items that have the
+    specified ``configuration`` key value in a namespace. The values for a
+    namespace and key are indexed on the first query and the index is dropped
+    whenever metadata in the namespace changes, so repeated queries only cost
+    a dictionary lookup.
+
+    Examples:
+        .. code-block::
+
+            # Get the names of the Items with a key value
+            items_with_key_value("Namespace_Name", ["Key", "Subkey"], "Value")
+
+    Args:
+        namespace (str): name of the namespace
+        keys (str or list): ``configuration`` key, or a list of keys in
+            descending branches
+        value: the value to match
+
+    Returns:
+        list: a list of strings representing the names of the Items with the
+        matching key value
+    """
+    LOG.debug(u"items_with_key_value: namespace '{}', keys '{}', value '{}'", namespace, keys, value)
+    keys = (keys,) if isinstance(keys, basestring) else tuple(keys)
+    _ensure_index()
+    with _INDEX_LOCK:
+        index = _VALUE_INDEX.get(namespace, {}).get(keys)
+        item_names = list(_NAMESPACE_INDEX.get(namespace, ()))
+        generation = _INDEX_GENERATION[0]
+    if index is None:
+        values = {}
+        # dict and list values cannot be hashed, so they are compared directly
+        unhashable = []
+        for item_name in item_names:
+            current = _read(item_name, namespace)
+            if current is None:
+                continue
+            item_value = current[1]
+            try:
+                for key in keys:
+                    item_value = item_value[key]
+            except (KeyError, TypeError):
+                # the Item does not have this key path
+                continue
+            try:
+                values.setdefault(_value_key(item_value), set()).add(item_name)
+            except TypeError:
+                unhashable.append((item_name, item_value))
+        index = (values, unhashable)
+        with _INDEX_LOCK:
+            # values pending in a metadata_batch are not indexed
+            if generation == _INDEX_GENERATION[0] and not getattr(_BATCH, "changes", None):
+                _VALUE_INDEX.setdefault(namespace, {})[keys] = index
+    values, unhashable = index
+    try:
+        item_names = list(values.get(_value_key(value), ()))
+    except TypeError:
+        item_names = []
+    return item_names + [item_name for item_name, item_value in unhashable if item_value == value]
 
 
 def get_metadata(item_name, namespace):
@@ -108,8 +513,12 @@ def get_metadata(item_name, namespace):
         ``value`` and ``configuration`` dictionary, but will be ``None`` if
         the namespace or the Item does not exist
     """
-    LOG.debug(u"get_metadata: Item '{}', namespace '{}'".format(item_name, namespace))
-    return METADATA_REGISTRY.get(MetadataKey(namespace, item_name))
+    LOG.debug(u"get_metadata: Item '{}', namespace '{}'", item_name, namespace)
+    changes = getattr(_BATCH, "changes", None)
+    if changes is not None and (item_name, namespace) in changes:
+        entry = changes[(item_name, namespace)]
+        return Metadata(MetadataKey(namespace, item_name), entry[0], entry[1]) if entry is not None else None
+    return _get_cached(item_name, namespace)[0]
 
 
 def set_metadata(item_name, namespace, configuration, value=None, overwrite=False):
@@ -136,19 +545,17 @@ def set_metadata(item_name, namespace, configuration, value=None, overwrite=Fals
         overwrite (bool): if ``True``, existing namespace data will be
             discarded
     """
-    if overwrite:
-        remove_metadata(item_name, namespace)
-    metadata = get_metadata(item_name, namespace)
-    if metadata is None or overwrite:
-        LOG.debug(u"set_metadata: adding or overwriting metadata namespace with 'value: {}, configuration: {}': Item '{}', namespace '{}'".format(value, configuration, item_name, namespace))
-        METADATA_REGISTRY.add(Metadata(MetadataKey(namespace, item_name), value, configuration))
+    current = None if overwrite else _read(item_name, namespace)
+    if current is None:
+        LOG.debug(u"set_metadata: adding or overwriting metadata namespace with 'value: {}, configuration: {}': Item '{}', namespace '{}'", value, configuration, item_name, namespace)
+        _write(item_name, namespace, value, dict(configuration))
     else:
         if value is None:
-            value = metadata.value
-        new_configuration = dict(metadata.configuration).copy()
+            value = current[0]
+        new_configuration = dict(current[1])
         new_configuration.update(configuration)
-        LOG.debug(u"set_metadata: setting metadata namespace to 'value: {}, configuration: {}': Item '{}', namespace '{}'".format(value, new_configuration, item_name, namespace))
-        METADATA_REGISTRY.update(Metadata(MetadataKey(namespace, item_name), value, new_configuration))
+        LOG.debug(u"set_metadata: setting metadata namespace to 'value: {}, configuration: {}': Item '{}', namespace '{}'", value, new_configuration, item_name, namespace)
+        _write(item_name, namespace, value, new_configuration)
 
 
 def remove_metadata(item_name, namespace=None):
@@ -171,11 +578,18 @@ def remove_metadata(item_name, namespace=None):
             remove metadata in all namespaces for the specified Item
     """
     if namespace is None:
-        LOG.debug(u"remove_metadata (all): Item '{}'".format(item_name))
-        METADATA_REGISTRY.removeItemMetadata(item_name)
+        LOG.debug(u"remove_metadata (all): Item '{}'", item_name)
+        changes = getattr(_BATCH, "changes", None)
+        if changes is not None:
+            namespaces = set(get_all_namespaces(item_name))
+            namespaces.update(pending_namespace for pending_item_name, pending_namespace in changes if pending_item_name == item_name)
+            for pending_namespace in namespaces:
+                changes[(item_name, pending_namespace)] = None
+        else:
+            METADATA_REGISTRY.removeItemMetadata(item_name)
     else:
-        LOG.debug(u"remove_metadata: Item '{}', namespace '{}'".format(item_name, namespace))
-        METADATA_REGISTRY.remove(MetadataKey(namespace, item_name))
+        LOG.debug(u"remove_metadata: Item '{}', namespace '{}'", item_name, namespace)
+        _write(item_name, namespace, None, None)
 
 
 def get_key_value(item_name, namespace, *args):
@@ -195,21 +609,23 @@ def get_key_value(item_name, namespace, *args):
             descending branches can be used)
 
     Returns:
-        str, decimal, boolean, None, or dict: The ``configuration`` key value
-        will be returned. Since None is a valid value for a key, when the key,
-        Item or namespace does not exist, this function will return an empty
-        dictionary.
-    """
-    LOG.debug(u"get_key_value: Item '{}', namespace '{}', args '{}'".format(item_name, namespace, args))
-    metadata = get_metadata(item_name, namespace)
-    if metadata is not None:
-        result = metadata.configuration.get(args[0])
+        str, long, float, boolean, None, list or dict: The ``configuration``
+        key value will be returned, with numbers as longs, or floats if they
+        have a fractional part. Dicts and lists are copies, so changing them
+        does not change the metadata. Since None is a valid value for a key,
+        when the key, Item or namespace does not exist, this function will
+        return an empty dictionary.
+    """
+    LOG.debug(u"get_key_value: Item '{}', namespace '{}', args '{}'", item_name, namespace, args)
+    current = _read(item_name, namespace)
+    if current is not None:
+        result = current[1].get(args[0])
         if result is None:
             return {}
         else:
             for arg in args[1:]:
                 result = result.get(arg, {})
-            return result
+            return _detached(result)
     else:
         return {}
 
@@ -231,23 +647,20 @@ def set_key_value(item_name, namespace, *args):
             branches can be used)
         value (str, decimal, boolean, dict or None): value to set
     """
-    LOG.debug(u"set_key_value: Item '{}', namespace '{}', args '{}'".format(item_name, namespace, args))
+    LOG.debug(u"set_key_value: Item '{}', namespace '{}', args '{}'", item_name, namespace, args)
     if len(args) > 1:
-        metadata = get_metadata(item_name, namespace)
-        new_configuration = {}
-        if metadata is not None:
-            new_configuration = dict(metadata.configuration).copy()
+        current = _read(item_name, namespace)
+        new_configuration = dict(current[1]) if current is not None else {}
         sub_dict = new_configuration
-        for arg in args[:-1]:
-            if arg not in sub_dict.keys():
-                sub_dict[arg] = {}
-            if arg == args[-2]:
-                sub_dict[arg] = args[-1]
-            else:
-                sub_dict = sub_dict[arg]
-        set_metadata(item_name, namespace, new_configuration)
+        for arg in args[:-2]:
+            # copy each branch on the path, since the current configuration
+            # is shared with the cache
+            sub_dict[arg] = dict(sub_dict[arg]) if isinstance(sub_dict.get(arg), dict) else {}
+            sub_dict = sub_dict[arg]
+        sub_dict[args[-2]] = args[-1]
+        _write(item_name, namespace, current[0] if current is not None else None, new_configuration)
     else:
-        LOG.warn(u"set_key_value: at least two args required: args '{}'".format(args))
+        LOG.warn(u"set_key_value: at least two args required: args '{}'", args)
 
 
 def remove_key_value(item_name, namespace, *args):
@@ -266,22 +679,27 @@ def remove_key_value(item_name, namespace, *args):
         key (str): ``configuration`` key to remove (multiple keys in
             descending branches can be used)
     """
-    LOG.debug(u"remove_key_value: Item '{}', namespace '{}', args '{}'".format(item_name, namespace, args))
+    LOG.debug(u"remove_key_value: Item '{}', namespace '{}', args '{}'", item_name, namespace, args)
     if args:
-        metadata = get_metadata(item_name, namespace)
-        if metadata is not None:
-            new_configuration = dict(metadata.configuration).copy()
+        current = _read(item_name, namespace)
+        if current is not None:
+            new_configuration = dict(current[1])
             sub_dict = new_configuration
-            for arg in args:
-                if arg != args[-1]:
-                    sub_dict = sub_dict.get(arg, {})
-                elif sub_dict != {}:
-                    sub_dict.pop(arg)
-                else:
-                    LOG.warn(u"remove_key_value: key does not exist: Item '{}', namespace '{}', args '{}'".format(item_name, namespace, args))
-            set_metadata(item_name, namespace, new_configuration, metadata.value, True)
+            for arg in args[:-1]:
+                if not isinstance(sub_dict.get(arg), dict):
+                    sub_dict = {}
+                    break
+                # copy each branch on the path, since the current
+                # configuration is shared with the cache
+                sub_dict[arg] = dict(sub_dict[arg])
+                sub_dict = sub_dict[arg]
+            if args[-1] in sub_dict:
+                sub_dict.pop(args[-1])
+                _write(item_name, namespace, current[0], new_configuration)
+            else:
+                LOG.warn(u"remove_key_value: key does not exist: Item '{}', namespace '{}', args '{}'", item_name, namespace, args)
         else:
-            LOG.warn(u"remove_key_value: metadata does not exist: Item '{}', namespace '{}'".format(item_name, namespace))
+            LOG.warn(u"remove_key_value: metadata does not exist: Item '{}', namespace '{}'", item_name, namespace)
     else:
         LOG.warn("remove_key_value: at least one key is required")
 
@@ -305,10 +723,10 @@ def get_value(item_name, namespace):
         str or None: namespace ``value`` or ``None`` if the namespace or
         Item does not exist
     """
-    LOG.debug(u"get_value: Item '{}', namespace '{}'".format(item_name, namespace))
-    metadata = get_metadata(item_name, namespace)
-    if metadata is not None:
-        return metadata.value
+    LOG.debug(u"get_value: Item '{}', namespace '{}'", item_name, namespace)
+    current = _read(item_name, namespace)
+    if current is not None:
+        return current[0]
     else:
         return None
 
@@ -329,9 +747,184 @@ def set_value(item_name, namespace, value):
         namespace (str): name of the namespace
         value (str): new or updated namespace value
     """
-    LOG.debug(u"set_value: Item '{}', namespace '{}', value '{}'".format(item_name, namespace, value))
-    metadata = get_metadata(item_name, namespace)
-    if metadata is not None:
-        set_metadata(item_name, namespace, metadata.configuration, value, True)
-    else:
-        set_metadata(item_name, namespace, {}, value)
+    LOG.debug(u"set_value: Item '{}', namespace '{}', value '{}'", item_name, namespace, value)
+    current = _read(item_name, namespace)
+    _write(item_name, namespace, value, current[1] if current is not None else {})
+
+
+class _MetadataPath(object):
+
+    __slots__ = ("namespace", "keys")
+
+    def __init__(self, namespace, keys):
+        self.namespace = namespace
+        self.keys = keys
+
+    def get(self, item_name, default=None):
+        current = _read(item_name, self.namespace)
+        if current is None:
+            return default
+        result = current[1]
+        try:
+            for key in self.keys:
+                result = result[key]
+        except (KeyError, TypeError):
+            return default
+        return _detached(result)
+
+    def set(self, item_name, value):
+        set_key_value(item_name, self.namespace, *(self.keys + (value,)))
+
+    def remove(self, item_name):
+        remove_key_value(item_name, self.namespace, *self.keys)
+
+    def __repr__(self):
+        return u"metadata_path({})".format(u", ".join(repr(part) for part in (self.namespace,) + self.keys))
+
+
+def metadata_path(namespace, *keys):
+    """
+    This function returns an accessor for a ``configuration`` key path in a
+    namespace. The path is split once, when the accessor is created, and
+    ``get`` reads straight from the cached ``configuration``, so accessors
+    created at script load avoid the per call overhead of ``get_key_value``
+    in frequently triggered rules.
+
+    The accessor has the following methods:
+
+    * **get(item_name, default=None)** - returns the key value, or
+      ``default`` if the Item, namespace or key does not exist
+    * **set(item_name, value)** - same as ``set_key_value``
+    * **remove(item_name)** - same as ``remove_key_value``
+
+    Examples:
+        .. code-block::
+
+            MODES = metadata_path("Namespace_Name", "Key", "Subkey")
+            modes = MODES.get("Item_Name", {})
+            MODES.set("Item_Name", {"Morning": 10})
+
+    Args:
+        namespace (str): name of the namespace
+        key (str): ``configuration`` key (multiple keys in descending
+            branches can be used). If no keys are provided, ``get`` returns
+            the whole ``configuration``.
+
+    Returns:
+        accessor: an accessor object for the key path
+    """
+    return _MetadataPath(namespace, tuple(keys))
+
+
+# snapshot files start with _SNAPSHOT_HEADER, followed by records of a 4 byte
+# big-endian length and a JSON array of [item name, namespace, value,
+# configuration]
+_SNAPSHOT_HEADER = "OHMD\x01"
+_SNAPSHOT_LENGTH = struct.Struct(">I")
+
+
+def _snapshot_default(value):
+    if isinstance(value, (BigDecimal, BigInteger)):
+        return _to_python_number(value)
+    return unicode(value)
+
+
+def _read_snapshot(path):
+    with open(path, "rb") as snapshot_file:
+        if snapshot_file.read(len(_SNAPSHOT_HEADER)) != _SNAPSHOT_HEADER:
+            raise ValueError(u"'{}' is not a metadata snapshot".format(path))
+        while True:
+            length = snapshot_file.read(_SNAPSHOT_LENGTH.size)
+            if not length:
+                break
+            record = snapshot_file.read(_SNAPSHOT_LENGTH.unpack(length)[0])
+            yield json.loads(record.decode("utf-8"))
+
+
+def export_snapshot(path, namespaces=None):
+    """
+    This function writes the Item metadata to a snapshot file, which can be
+    loaded with ``import_snapshot``. Records are written one at a time, so
+    the file is never held in memory.
+
+    Examples:
+        .. code-block::
+
+            # Export all metadata
+            export_snapshot("/tmp/metadata.snapshot")
+
+            # Export the metadata in specific namespaces
+            export_snapshot("/tmp/metadata.snapshot", ["Namespace_1", "Namespace_2"])
+
+    Args:
+        path (str): the path of the snapshot file to write
+        namespaces (list): (optional) the names of the namespaces to export,
+            or ``None`` to export all namespaces
+
+    Returns:
+        int: the number of namespaces written
+    """
+    LOG.debug(u"export_snapshot: path '{}', namespaces '{}'", path, namespaces)
+    namespaces = set(namespaces) if namespaces is not None else None
+    count = 0
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(_SNAPSHOT_HEADER)
+        for metadata in METADATA_REGISTRY.getAll():
+            if namespaces is not None and metadata.UID.namespace not in namespaces:
+                continue
+            record = json.dumps([metadata.UID.itemName, metadata.UID.namespace, metadata.value, _to_python(metadata.configuration)], default=_snapshot_default, separators=(",", ":")).encode("utf-8")
+            snapshot_file.write(_SNAPSHOT_LENGTH.pack(len(record)))
+            snapshot_file.write(record)
+            count += 1
+    LOG.debug(u"export_snapshot: {} namespaces written to '{}'", count, path)
+    return count
+
+
+def import_snapshot(path, mode="merge"):
+    """
+    This function applies a snapshot file written by ``export_snapshot``.
+    All of the changes are applied in a single ``metadata_batch``, so
+    namespaces that are already up to date do not cause registry events and
+    nothing is changed if the file cannot be read.
+
+    Examples:
+        .. code-block::
+
+            # Overlay the snapshot on top of the existing metadata
+            import_snapshot("/tmp/metadata.snapshot")
+
+            # Make the namespaces in the snapshot match it exactly
+            import_snapshot("/tmp/metadata.snapshot", mode="replace")
+
+    Args:
+        path (str): the path of the snapshot file to read
+        mode (str): ``merge`` to overlay the ``configuration`` keys in the
+            snapshot on top of the existing ones, like ``set_metadata``
+            (default), or ``replace`` to overwrite the namespaces in the
+            snapshot and remove metadata in those namespaces from Items that
+            are not in the snapshot
+
+    Returns:
+        int: the number of namespaces read from the snapshot
+
+    Raises:
+        ValueError: if ``mode`` is not supported or the file is not a
+            snapshot
+    """
+    LOG.debug(u"import_snapshot: path '{}', mode '{}'", path, mode)
+    if mode not in ["merge", "replace"]:
+        raise ValueError(u"'{}' is not a supported import mode".format(mode))
+    count = 0
+    imported = set()
+    with metadata_batch():
+        for item_name, namespace, value, configuration in _read_snapshot(path):
+            set_metadata(item_name, namespace, configuration, value, overwrite=(mode == "replace"))
+            imported.add((item_name, namespace))
+            count += 1
+        if mode == "replace":
+            for namespace in set(namespace for _, namespace in imported):
+                for item_name in items_with_namespace(namespace):
+                    if (item_name, namespace) not in imported:
+                        remove_metadata(item_name, namespace)
+    LOG.debug(u"import_snapshot: {} namespaces read from '{}'", count, path)
+    return count
@@ -1,6 +1,12 @@
 """
 Provides utility functions for retrieving, registering and removing OSGi
 services.
+
+Services retrieved with ``get_service`` and ``find_services`` are cached by
+class name and filter. A ``ServiceListener``, filtered to the cached classes,
+drops the cached entries for a class whenever a service of that class is
+registered, modified or unregistered, so repeated lookups are a dictionary hit
+and references are not kept after a bundle restart.
 """
 __all__ = [
     'REGISTERED_SERVICES',
@@ -10,8 +16,10 @@ __all__ = [
     'unregister_service'
 ]
 
+from threading import RLock
+
 from core.jsr223.scope import scriptExtension
-from org.osgi.framework import FrameworkUtil
+from org.osgi.framework import FrameworkUtil, ServiceEvent, ServiceListener
 from core.log import logging, LOG_PREFIX
 
 _BUNDLE = FrameworkUtil.getBundle(type(scriptExtension))
@@ -19,6 +27,97 @@ BUNDLE_CONTEXT = _BUNDLE.getBundleContext() if _BUNDLE else None
 REGISTERED_SERVICES = {}
 LOG = logging.getLogger("{}.core.osgi".format(LOG_PREFIX))
 
+# {class name: {filter: (references, services)}}, where the filter key for
+# get_service is _BEST_MATCH
+_SERVICE_CACHE = {}
+_SERVICE_CACHE_LOCK = RLock()
+# incremented on every invalidation, so that a lookup racing with a service
+# event does not cache a reference that has already been dropped
+_SERVICE_CACHE_GENERATION = [0]
+_SERVICE_LISTENER = []
+# the class names the listener is filtered to, guarded by its own lock, since
+# addServiceListener must not be called while holding _SERVICE_CACHE_LOCK
+_LISTENED_CLASS_NAMES = set()
+_SERVICE_LISTENER_LOCK = RLock()
+_BEST_MATCH = object()
+
+
+class _ServiceCacheListener(ServiceListener):
+
+    def serviceChanged(self, event):
+        reference = event.getServiceReference()
+        class_names = reference.getProperty("objectClass")
+        if class_names:
+            # only a service that is going away is released, since the
+            # services returned earlier may still be held by other modules
+            released = reference if event.getType() == ServiceEvent.UNREGISTERING else None
+            _invalidate_services(class_names, released)
+
+
+def _invalidate_services(class_names, released_reference=None):
+    """
+    Removes the cached services for the specified class names. If
+    ``released_reference`` is given, the cache's use of that reference is
+    released for each entry that held it.
+    """
+    with _SERVICE_CACHE_LOCK:
+        _SERVICE_CACHE_GENERATION[0] += 1
+        entries = [_SERVICE_CACHE.pop(class_name) for class_name in class_names if class_name in _SERVICE_CACHE]
+    if released_reference is None:
+        return
+    for entry in entries:
+        for references, _ in entry.itervalues():
+            if released_reference in references:
+                _unget_services([released_reference])
+
+
+def _unget_services(references):
+    for reference in references:
+        try:
+            BUNDLE_CONTEXT.ungetService(reference)
+        except:
+            pass
+
+
+def _listen_for(class_name):
+    """
+    Makes sure the cache listener receives the events for ``class_name``,
+    replacing its filter when a new class name is cached.
+    """
+    with _SERVICE_LISTENER_LOCK:
+        if class_name in _LISTENED_CLASS_NAMES:
+            return
+        _LISTENED_CLASS_NAMES.add(class_name)
+        if not _SERVICE_LISTENER:
+            _SERVICE_LISTENER.append(_ServiceCacheListener())
+        service_filter = "(|{})".format("".join("(objectClass={})".format(name) for name in sorted(_LISTENED_CLASS_NAMES)))
+        # adding the same listener again replaces its filter
+        BUNDLE_CONTEXT.addServiceListener(_SERVICE_LISTENER[0], service_filter)
+
+
+def _cached_services(class_name, key, lookup):
+    """
+    Returns the ``(references, services)`` tuple cached for ``class_name`` and
+    ``key``, calling ``lookup`` to populate the cache on a miss.
+    """
+    with _SERVICE_CACHE_LOCK:
+        entry = _SERVICE_CACHE.get(class_name, {}).get(key)
+        if entry is not None:
+            return entry
+        generation = _SERVICE_CACHE_GENERATION[0]
+    # the listener is added and the lookup is done outside of the lock, since
+    # the framework may call the listener while holding its own locks
+    _listen_for(class_name)
+    entry = lookup()
+    with _SERVICE_CACHE_LOCK:
+        if generation == _SERVICE_CACHE_GENERATION[0]:
+            _SERVICE_CACHE.setdefault(class_name, {})[key] = entry
+            return entry
+    # a service event arrived during the lookup, so the references are not
+    # cached and are released again
+    _unget_services(entry[0])
+    return entry
+
 
 def get_service(class_or_name):
     """
@@ -33,8 +132,11 @@ def get_service(class_or_name):
     """
     if BUNDLE_CONTEXT:
         classname = class_or_name.getName() if isinstance(class_or_name, type) else class_or_name
-        ref = BUNDLE_CONTEXT.getServiceReference(classname)
-        return BUNDLE_CONTEXT.getService(ref) if ref else None
+        def lookup():
+            ref = BUNDLE_CONTEXT.getServiceReference(classname)
+            service = BUNDLE_CONTEXT.getService(ref) if ref else None
+            return ([ref], [service]) if service is not None else ([], [None])
+        return _cached_services(classname, _BEST_MATCH, lookup)[1][0]
     else:
         return None
 
@@ -52,11 +154,12 @@ def find_services(class_name, service_filter):
         list: a list of matching OSGi services
     """
     if BUNDLE_CONTEXT:
-        references = BUNDLE_CONTEXT.getServiceReferences(class_name, service_filter)
-        if references:
-            return [BUNDLE_CONTEXT.getService(reference) for reference in references]
-        else:
-            return []
+        def lookup():
+            references = BUNDLE_CONTEXT.getServiceReferences(class_name, service_filter) or []
+            found = [(reference, BUNDLE_CONTEXT.getService(reference)) for reference in references]
+            found = [(reference, service) for reference, service in found if service is not None]
+            return ([reference for reference, _ in found], [service for _, service in found])
+        return list(_cached_services(class_name, service_filter, lookup)[1])
     else:
         return None
 
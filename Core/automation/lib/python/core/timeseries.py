@@ -0,0 +1,267 @@
+"""
+This module provides a fixed size buffer for recent numeric readings, such as
+the wind speeds or temperatures that a rule needs to calculate an average or
+gust value from. Values and timestamps are stored in arrays, so each reading
+takes 16 bytes, and the minimum, maximum and mean are maintained as readings
+are added instead of being calculated from all readings each time.
+
+Examples:
+    .. code-block::
+
+        from core.timeseries import TimeSeries
+
+        # the last 10 minutes of readings, but no more than 600 readings
+        WIND_SPEED = TimeSeries(600, max_age=10 * 60 * 1000)
+        WIND_SPEED.feed_from("Wind_Speed")
+
+        @rule("Report wind gust")
+        @when("Time cron 0 0/10 * * * ?")
+        def report_wind_gust(event):
+            if WIND_SPEED:
+                events.postUpdate("Wind_Gust", str(WIND_SPEED.max()))
+                events.postUpdate("Wind_Speed_Average", str(WIND_SPEED.mean()))
+"""
+__all__ = ["TimeSeries"]
+
+from array import array
+from collections import deque
+from threading import RLock
+
+from java.lang import System
+
+from core.log import logging, LOG_PREFIX
+
+LOG = logging.getLogger(u"{}.core.timeseries".format(LOG_PREFIX))
+
+
+class TimeSeries(object):
+    """
+    A ring buffer of up to ``capacity`` readings, each made of a float value
+    and a timestamp in epoch milliseconds. When the buffer is full, adding a
+    reading drops the oldest one. If ``max_age`` is set, readings older than
+    ``max_age`` milliseconds are also dropped when readings are added or
+    statistics are requested.
+
+    ``append``, ``min``, ``max`` and ``mean`` take constant (amortized) time,
+    and ``percentile`` sorts a copy of the readings.
+
+    Args:
+        capacity (int): the maximum number of readings to keep
+        max_age (int): (optional) the maximum age of a reading in
+            milliseconds
+    """
+
+    def __init__(self, capacity, max_age=None):
+        if capacity < 1:
+            raise ValueError(u"capacity must be at least 1, not {}".format(capacity))
+        self.capacity = capacity
+        self.max_age = max_age
+        self._values = array('d', [0.0]) * capacity
+        self._timestamps = array('l', [0]) * capacity
+        # sequence numbers of the oldest reading and of the next reading, so
+        # that a reading is at index sequence % capacity
+        self._start = 0
+        self._end = 0
+        self._sum = 0.0
+        # sequence numbers of the candidates for the minimum and maximum,
+        # with increasing and decreasing values respectively
+        self._min_candidates = deque()
+        self._max_candidates = deque()
+        self._lock = RLock()
+
+    def __len__(self):
+        with self._lock:
+            self._expire(System.currentTimeMillis())
+            return self._end - self._start
+
+    def __repr__(self):
+        return u"<TimeSeries {} of {} readings>".format(self._end - self._start, self.capacity)
+
+    def _drop_oldest(self):
+        sequence = self._start
+        self._sum -= self._values[sequence % self.capacity]
+        self._start += 1
+        if self._min_candidates[0] == sequence:
+            self._min_candidates.popleft()
+        if self._max_candidates[0] == sequence:
+            self._max_candidates.popleft()
+        if self._start == self._end:
+            # start from an exact sum again, so rounding errors do not add up
+            self._sum = 0.0
+
+    def _expire(self, now):
+        if self.max_age is not None:
+            oldest_allowed = now - self.max_age
+            while self._start < self._end and self._timestamps[self._start % self.capacity] < oldest_allowed:
+                self._drop_oldest()
+
+    def append(self, value, timestamp=None):
+        """
+        Adds a reading.
+
+        Args:
+            value (float): the value of the reading
+            timestamp (int): (optional) the time of the reading in epoch
+                milliseconds, defaults to now
+        """
+        value = float(value)
+        if timestamp is None:
+            timestamp = System.currentTimeMillis()
+        with self._lock:
+            self._expire(timestamp)
+            if self._end - self._start == self.capacity:
+                self._drop_oldest()
+            sequence = self._end
+            index = sequence % self.capacity
+            self._values[index] = value
+            self._timestamps[index] = timestamp
+            self._end += 1
+            self._sum += value
+            min_candidates = self._min_candidates
+            while min_candidates and self._values[min_candidates[-1] % self.capacity] >= value:
+                min_candidates.pop()
+            min_candidates.append(sequence)
+            max_candidates = self._max_candidates
+            while max_candidates and self._values[max_candidates[-1] % self.capacity] <= value:
+                max_candidates.pop()
+            max_candidates.append(sequence)
+
+    def clear(self):
+        """
+        Removes all readings.
+        """
+        with self._lock:
+            self._start = self._end
+            self._sum = 0.0
+            self._min_candidates.clear()
+            self._max_candidates.clear()
+
+    def _extreme(self, candidates):
+        with self._lock:
+            self._expire(System.currentTimeMillis())
+            if not candidates:
+                return None
+            return self._values[candidates[0] % self.capacity]
+
+    def min(self):
+        """
+        Returns:
+            float or None: the lowest value, or ``None`` if there are no
+            readings
+        """
+        return self._extreme(self._min_candidates)
+
+    def max(self):
+        """
+        Returns:
+            float or None: the highest value, or ``None`` if there are no
+            readings
+        """
+        return self._extreme(self._max_candidates)
+
+    def mean(self):
+        """
+        Returns:
+            float or None: the mean of the values, or ``None`` if there are no
+            readings
+        """
+        with self._lock:
+            self._expire(System.currentTimeMillis())
+            count = self._end - self._start
+            if count == 0:
+                return None
+            return self._sum / count
+
+    def percentile(self, percent):
+        """
+        Returns the value below which ``percent`` percent of the values fall,
+        interpolating linearly between the two nearest values.
+
+        Examples:
+            .. code-block::
+
+                median = series.percentile(50)
+
+        Args:
+            percent (float): the percentile, from 0 to 100
+
+        Returns:
+            float or None: the percentile, or ``None`` if there are no
+            readings
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(u"percent must be between 0 and 100, not {}".format(percent))
+        values = sorted(self.values())
+        if not values:
+            return None
+        position = (len(values) - 1) * percent / 100.0
+        lower = int(position)
+        if lower == len(values) - 1:
+            return values[lower]
+        return values[lower] + (values[lower + 1] - values[lower]) * (position - lower)
+
+    def values(self):
+        """
+        Returns:
+            list: the values, oldest first
+        """
+        return [value for _, value in self.items()]
+
+    def timestamps(self):
+        """
+        Returns:
+            list: the timestamps in epoch milliseconds, oldest first
+        """
+        return [timestamp for timestamp, _ in self.items()]
+
+    def items(self):
+        """
+        Returns:
+            list: ``(epoch milliseconds, value)`` tuples, oldest first
+        """
+        with self._lock:
+            self._expire(System.currentTimeMillis())
+            indexes = [sequence % self.capacity for sequence in xrange(self._start, self._end)]
+            return [(self._timestamps[index], self._values[index]) for index in indexes]
+
+    def feed_from(self, item_name, trigger_type="changed"):
+        """
+        Creates a rule that appends the State of an Item every time it changes
+        or is updated. States that are NULL or UNDEF are skipped. The rule is
+        removed when the script that called this function is unloaded.
+
+        Examples:
+            .. code-block::
+
+                series.feed_from("Outdoor_Temperature")
+                series.feed_from("Rain_Gauge", "received update")
+
+        Args:
+            item_name (str): the name of the Item
+            trigger_type (str): (optional) ``"changed"`` (default) or
+                ``"received update"``
+
+        Returns:
+            str: the UID of the rule
+
+        Raises:
+            ValueError: if the rule could not be created
+        """
+        from core.rules import rule
+        from core.triggers import when
+        from core.jsr223.scope import UnDefType
+
+        if trigger_type not in ["changed", "received update"]:
+            raise ValueError(u"trigger_type must be 'changed' or 'received update', not '{}'".format(trigger_type))
+
+        def feed(event):
+            if not isinstance(event.itemState, UnDefType):
+                self.append(event.itemState.floatValue())
+
+        feed_rule = rule(u"TimeSeries feed from {}".format(item_name), tags=["TimeSeries"])(
+            when(u"Item {} {}".format(item_name, trigger_type))(feed)
+        )
+        if feed_rule is None:
+            raise ValueError(u"Could not create a rule to feed from '{}'".format(item_name))
+        LOG.debug(u"Feeding TimeSeries from '{}' with rule '{}'".format(item_name, feed_rule.UID))
+        return feed_rule.UID
@@ -28,7 +28,7 @@ from java.nio.file.StandardWatchEventKinds import ENTRY_CREATE, ENTRY_DELETE, EN
 from core.jsr223.scope import scriptExtension
 scriptExtension.importPreset("RuleSupport")
 from core.jsr223.scope import TriggerBuilder, Configuration, Trigger
-from core.utils import validate_uid
+from core.utils import validate_uid, parse_state, parse_command
 
 
 def when(target):
@@ -76,7 +76,7 @@ def when(target):
         from org.quartz.CronExpression import isValidExpression
 
         from core.jsr223.scope import itemRegistry, things
-        from core.log import logging, LOG_PREFIX
+        from core.log import LOG_PREFIX, lazy_logger
 
         try:
             from org.openhab.core.thing import ChannelUID, ThingUID, ThingStatus
@@ -85,12 +85,7 @@ def when(target):
             from org.eclipse.smarthome.core.thing import ChannelUID, ThingUID, ThingStatus
             from org.eclipse.smarthome.core.thing.type import ChannelKind
 
-        try:
-            from org.eclipse.smarthome.core.types import TypeParser
-        except:
-            from org.openhab.core.types import TypeParser
-
-        LOG = logging.getLogger(u"{}.core.triggers".format(LOG_PREFIX))
+        LOG = lazy_logger(u"{}.core.triggers".format(LOG_PREFIX))
 
 
         def item_trigger(function):
@@ -129,14 +124,14 @@ def when(target):
                         function.triggers.append(ItemCommandTrigger(member.name, command=new_state, trigger_name=trigger_name).trigger)
                     else:
                         function.triggers.append(ItemStateChangeTrigger(member.name, previous_state=old_state, state=new_state, trigger_name=trigger_name).trigger)
-                    LOG.debug(u"when: Created item_trigger: '{}'".format(trigger_name))
+                    LOG.debug(u"when: Created item_trigger: '{}'", trigger_name)
             return function
 
         def cron_trigger(function):
             if not hasattr(function, 'triggers'):
                 function.triggers = []
             function.triggers.append(CronTrigger(trigger_type, trigger_name=trigger_name).trigger)
-            LOG.debug(u"when: Created cron_trigger: '{}'".format(trigger_name))
+            LOG.debug(u"when: Created cron_trigger: '{}'", trigger_name)
             return function
 
         def system_trigger(function):
@@ -146,7 +141,7 @@ def when(target):
             function.triggers.append(StartupTrigger(trigger_name=trigger_name).trigger)
             #else:
             #    function.triggers.append(ShutdownTrigger(trigger_name=trigger_name).trigger)
-            LOG.debug(u"when: Created system_trigger: '{}'".format(trigger_name))
+            LOG.debug(u"when: Created system_trigger: '{}'", trigger_name)
             return function
 
         def thing_trigger(function):
@@ -167,14 +162,14 @@ def when(target):
             else:
                 event_types = "ThingStatusInfoChangedEvent" if trigger_type == "changed" else "ThingStatusInfoEvent"
                 function.triggers.append(ThingEventTrigger(event_types, trigger_target, trigger_name=trigger_name).trigger)
-            LOG.debug(u"when: Created thing_trigger: '{}'".format(trigger_name))
+            LOG.debug(u"when: Created thing_trigger: '{}'", trigger_name)
             return function
 
         def channel_trigger(function):
             if not hasattr(function, 'triggers'):
                 function.triggers = []
             function.triggers.append(ChannelEventTrigger(trigger_target, event=new_state, trigger_name=trigger_name).trigger)
-            LOG.debug(u"when: Created channel_trigger: '{}'".format(trigger_name))
+            LOG.debug(u"when: Created channel_trigger: '{}'", trigger_name)
             return function
 
         def directory_trigger(function):
@@ -190,7 +185,7 @@ def when(target):
             if event_kinds == []:
                 event_kinds = [ENTRY_CREATE, ENTRY_DELETE, ENTRY_MODIFY]
             function.triggers.append(DirectoryEventTrigger(trigger_target, event_kinds=event_kinds, watch_subdirectories=target_type == "Subdirectory", trigger_name=trigger_name).trigger)
-            LOG.debug(u"when: Created channel_trigger: '{}'".format(trigger_name))
+            LOG.debug(u"when: Created channel_trigger: '{}'", trigger_name)
             return function
 
         target_type = None
@@ -313,11 +308,11 @@ def when(target):
             raise ValueError(u"when: \"{}\" could not be parsed because Item '{}' is not in the ItemRegistry".format(target, trigger_target))
         elif target_type in ["Member of", "Descendent of"] and itemRegistry.getItem(trigger_target).type != "Group":
             raise ValueError(u"when: \"{}\" could not be parsed because '{}' was specified, but '{}' is not a group".format(target, target_type, trigger_target))
-        elif target_type == "Item" and trigger_target not in ["added", "removed", "updated"] and old_state is not None and trigger_type == "changed" and TypeParser.parseState(itemRegistry.getItem(trigger_target).acceptedDataTypes, old_state) is None:
+        elif target_type == "Item" and trigger_target not in ["added", "removed", "updated"] and old_state is not None and trigger_type == "changed" and parse_state(itemRegistry.getItem(trigger_target).acceptedDataTypes, old_state) is None:
             raise ValueError(u"when: \"{}\" could not be parsed because '{}' is not a valid state for '{}'".format(target, old_state, trigger_target))
-        elif target_type == "Item" and trigger_target not in ["added", "removed", "updated"] and new_state is not None and (trigger_type == "changed" or trigger_type == "received update") and TypeParser.parseState(itemRegistry.getItem(trigger_target).acceptedDataTypes, new_state) is None:
+        elif target_type == "Item" and trigger_target not in ["added", "removed", "updated"] and new_state is not None and (trigger_type == "changed" or trigger_type == "received update") and parse_state(itemRegistry.getItem(trigger_target).acceptedDataTypes, new_state) is None:
             raise ValueError(u"when: \"{}\" could not be parsed because '{}' is not a valid state for '{}'".format(target, new_state, trigger_target))
-        elif target_type == "Item" and trigger_target not in ["added", "removed", "updated"] and new_state is not None and trigger_type == "received command" and TypeParser.parseCommand(itemRegistry.getItem(trigger_target).acceptedCommandTypes, new_state) is None:
+        elif target_type == "Item" and trigger_target not in ["added", "removed", "updated"] and new_state is not None and trigger_type == "received command" and parse_command(itemRegistry.getItem(trigger_target).acceptedCommandTypes, new_state) is None:
             raise ValueError(u"when: \"{}\" could not be parsed because '{}' is not a valid command for '{}'".format(target, new_state, trigger_target))
         elif target_type == "Thing" and trigger_target not in ["added", "removed", "updated"] and things.get(ThingUID(trigger_target)) is None:# returns null if Thing does not exist
             raise ValueError(u"when: \"{}\" could not be parsed because Thing '{}' is not in the ThingRegistry".format(target, trigger_target))
@@ -338,7 +333,7 @@ def when(target):
         elif target_type in ["Directory", "Subdirectory"] and any(event_kind for event_kind in trigger_type if event_kind not in ["created", "deleted", "modified"]):
             raise ValueError(u"when: \"{}\" could not be parsed. trigger_target '{}' is invalid for target_type '{}'.".format(target, trigger_target, target_type))
 
-        LOG.debug(u"when: target: '{}', target_type: '{}', trigger_target: '{}', trigger_type: '{}', old_state: '{}', new_state: '{}'".format(target, target_type, trigger_target, trigger_type, old_state, new_state))
+        LOG.debug(u"when: target: '{}', target_type: '{}', trigger_target: '{}', trigger_type: '{}', old_state: '{}', new_state: '{}'", target, target_type, trigger_target, trigger_type, old_state, new_state)
 
         trigger_name = validate_uid(trigger_name or target)
         if target_type in ["Item", "Member of", "Descendent of"]:
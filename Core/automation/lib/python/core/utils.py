@@ -5,8 +5,18 @@ This module provides miscellaneous utility functions that are used across the co
 __all__ = [
     "validate_channel_uid",
     "validate_uid",
+    "parse_state",
+    "parse_command",
     "kw",
     "iround",
+    "item_float",
+    "item_int",
+    "item_onoff",
+    "snapshot",
+    "last_update",
+    "last_updates",
+    "stop_last_update_tracking",
+    "history",
     "getItemValue",
     "getLastUpdate",
     "sendCommand",
@@ -14,11 +24,18 @@ __all__ = [
     "post_update_if_different",
     "postUpdateCheckFirst",
     "send_command_if_different",
-    "sendCommandCheckFirst"
+    "sendCommandCheckFirst",
+    "post_updates_if_different",
+    "send_commands_if_different",
+    "UpdateBuffer",
+    "buffered_updates"
 ]
 
 import re
 import uuid
+from collections import Mapping, OrderedDict
+from functools import wraps
+from threading import RLock, local
 
 try:
     from org.eclipse.smarthome.core.types import TypeParser
@@ -30,18 +47,148 @@ try:
 except:
     from org.eclipse.smarthome.core.thing import ChannelUID
 
+try:
+    from org.openhab.core.common.registry import RegistryChangeListener
+except:
+    from org.eclipse.smarthome.core.common.registry import RegistryChangeListener
+
+try:
+    from org.openhab.core.events import EventSubscriber
+    from org.openhab.core.items.events import ItemStateEvent
+    _EVENT_SUBSCRIBER_CLASS = "org.openhab.core.events.EventSubscriber"
+except:
+    from org.eclipse.smarthome.core.events import EventSubscriber
+    from org.eclipse.smarthome.core.items.events import ItemStateEvent
+    _EVENT_SUBSCRIBER_CLASS = "org.eclipse.smarthome.core.events.EventSubscriber"
+
+from java.lang import System
+from java.time import Instant, ZonedDateTime, ZoneId
+from java.util import Collections, Date
+
 from org.joda.time import DateTime
 
 from core.log import logging, LOG_PREFIX
-from core.jsr223.scope import itemRegistry, NULL, UNDEF, ON, OFF, OPEN, CLOSED, events, things
+from core.date import to_epoch_millis
+from core.jsr223.scope import itemRegistry, NULL, UNDEF, ON, OFF, OPEN, CLOSED, events, things, UnDefType, OnOffType, DecimalType
 
 
 LOG = logging.getLogger(u"{}.core.utils".format(LOG_PREFIX))
 
+# {item name: Item or None}, filled on lookup and kept current by ItemRegistry
+# events
+_ITEM_CACHE = {}
+# {thing UID: {channel UID: bool}}, filled on lookup and dropped for a Thing
+# by ThingRegistry events
+_CHANNEL_CACHE = {}
+_CACHE_LOCK = RLock()
+_CACHE_LISTENERS = []
+# incremented on every change, so that a lookup racing with an event does not
+# cache a stale result
+_CACHE_GENERATION = [0]
+
+# {(is command, accepted types, string): State, Command or None}, oldest
+# entries are evicted first once _PARSE_CACHE_SIZE is reached
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_SIZE = 1024
+_PARSE_CACHE_LOCK = RLock()
+
+# {item name: epoch milliseconds of the last update, or 0 if persistence has
+# no record of one}, kept current by ItemStateEvents
+_LAST_UPDATES = {}
+_LAST_UPDATE_LOCK = RLock()
+# [(EventSubscriber, ServiceRegistration)], when tracking has been started
+_LAST_UPDATE_SUBSCRIBER = []
+
+# {(conversion, item name, default type, default): _ItemStateAccessor}
+_ACCESSORS = {}
+
+
+class _ItemCacheListener(RegistryChangeListener):
+
+    def added(self, element):
+        _set_cached_item(element.name, element)
+
+    def removed(self, element):
+        _set_cached_item(element.name, None)
+
+    def updated(self, old_element, element):
+        _set_cached_item(element.name, element)
+
+
+class _ThingCacheListener(RegistryChangeListener):
+
+    def added(self, element):
+        _drop_cached_thing(element.UID)
+
+    def removed(self, element):
+        _drop_cached_thing(element.UID)
+
+    def updated(self, old_element, element):
+        _drop_cached_thing(element.UID)
+
+
+def _set_cached_item(item_name, item):
+    with _CACHE_LOCK:
+        _CACHE_GENERATION[0] += 1
+        _ITEM_CACHE[item_name] = item
+
+
+def _drop_cached_thing(thing_uid):
+    with _CACHE_LOCK:
+        _CACHE_GENERATION[0] += 1
+        _CHANNEL_CACHE.pop(str(thing_uid), None)
+
+
+def _ensure_cache_listeners():
+    if _CACHE_LISTENERS:
+        return
+    with _CACHE_LOCK:
+        if not _CACHE_LISTENERS:
+            item_listener = _ItemCacheListener()
+            itemRegistry.addRegistryChangeListener(item_listener)
+            thing_listener = _ThingCacheListener()
+            things.addRegistryChangeListener(thing_listener)
+            _CACHE_LISTENERS.extend([item_listener, thing_listener])
+
+
+def _get_item(item_name):
+    """
+    Returns the Item with the specified name, or ``None`` if it is not in the
+    ItemRegistry, using the Item cache.
+    """
+    _ensure_cache_listeners()
+    with _CACHE_LOCK:
+        if item_name in _ITEM_CACHE:
+            return _ITEM_CACHE[item_name]
+        generation = _CACHE_GENERATION[0]
+    item = itemRegistry.get(item_name)
+    with _CACHE_LOCK:
+        if generation == _CACHE_GENERATION[0]:
+            _ITEM_CACHE[item_name] = item
+    return item
+
+
+def _channel_exists(channel_uid):
+    _ensure_cache_listeners()
+    thing_uid = str(channel_uid.thingUID)
+    channel_uid_string = str(channel_uid)
+    with _CACHE_LOCK:
+        exists = _CHANNEL_CACHE.get(thing_uid, {}).get(channel_uid_string)
+        if exists is not None:
+            return exists
+        generation = _CACHE_GENERATION[0]
+    exists = things.getChannel(channel_uid) is not None
+    with _CACHE_LOCK:
+        if generation == _CACHE_GENERATION[0]:
+            _CHANNEL_CACHE.setdefault(thing_uid, {})[channel_uid_string] = exists
+    return exists
+
 
 def validate_item(item_or_item_name):
     """
     This function validates whether an Item exists or if an Item name is valid.
+    Lookups are served from a cache that is kept current by ItemRegistry
+    events.
 
     Args:
         item_or_item_name (Item or str): name of the Item
@@ -52,16 +199,15 @@ def validate_item(item_or_item_name):
     """
     item = item_or_item_name
     if isinstance(item, basestring):
-        if itemRegistry.getItems(item) == []:
-            LOG.warn(u"'{}' is not in the ItemRegistry".format(item))
-            return None
-        else:
-            item = itemRegistry.getItem(item_or_item_name)
+        item = _get_item(item_or_item_name)
+        if item is None:
+            LOG.warn(u"'{}' is not in the ItemRegistry".format(item_or_item_name))
+        return item
     elif not hasattr(item_or_item_name, 'name'):
         LOG.warn(u"'{}' is not a Item or string".format(item))
         return None
 
-    if itemRegistry.getItems(item.name) == []:
+    if _get_item(item.name) is None:
         LOG.warn(u"'{}' is not in the ItemRegistry".format(item.name))
         return None
 
@@ -71,7 +217,8 @@ def validate_item(item_or_item_name):
 def validate_channel_uid(channel_uid_or_string):
     """
     This function validates whether a ChannelUID exists or if a ChannelUID is
-        valid.
+        valid. Lookups are served from a cache that is kept current by
+        ThingRegistry events.
 
     Args:
         channel_uid_or_string (ChannelUID or str): the ChannelUID
@@ -86,7 +233,7 @@ def validate_channel_uid(channel_uid_or_string):
     elif not isinstance(channel_uid_or_string, ChannelUID):
         LOG.warn(u"'{}' is not a string or ChannelUID".format(channel_uid_or_string))
         return None
-    if things.getChannel(channel_uid) is None:
+    if not _channel_exists(channel_uid):
         LOG.warn(u"'{}' is not a valid Channel".format(channel_uid))
         return None
     return channel_uid
@@ -113,6 +260,66 @@ def validate_uid(uid):
     return uid
 
 
+def _parse(is_command, accepted_types, value):
+    key = (is_command, tuple(accepted_types), value)
+    try:
+        return _PARSE_CACHE[key]
+    except KeyError:
+        pass
+    if is_command:
+        result = TypeParser.parseCommand(accepted_types, value)
+    else:
+        result = TypeParser.parseState(accepted_types, value)
+    with _PARSE_CACHE_LOCK:
+        if key not in _PARSE_CACHE:
+            if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+            _PARSE_CACHE[key] = result
+    return result
+
+
+def parse_state(accepted_types, value):
+    """
+    Does the same as ``TypeParser.parseState``, but results are cached, so
+    repeatedly parsing the same value for the same accepted types (ON, OFF,
+    percentages, mode strings, etc.) does not go through the Java parser
+    again. The cache is bounded and States are immutable, so the returned
+    State can be used like the one returned by ``TypeParser``.
+
+    Examples:
+        .. code-block::
+
+            state = parse_state(itemRegistry.getItem("Test_Switch").acceptedDataTypes, "ON")
+
+    Args:
+        accepted_types (list): the State types to try, in order, such as
+            ``item.acceptedDataTypes``
+        value (str): the string to parse
+
+    Returns:
+        State or None: the parsed State, or ``None`` if the string is not
+        valid for any of the accepted types
+    """
+    return _parse(False, accepted_types, value)
+
+
+def parse_command(accepted_types, value):
+    """
+    Does the same as ``TypeParser.parseCommand``, with the same caching as
+    ``parse_state``.
+
+    Args:
+        accepted_types (list): the Command types to try, in order, such as
+            ``item.acceptedCommandTypes``
+        value (str): the string to parse
+
+    Returns:
+        Command or None: the parsed Command, or ``None`` if the string is not
+        valid for any of the accepted types
+    """
+    return _parse(True, accepted_types, value)
+
+
 def post_update_if_different(item_or_item_name, new_value, sendACommand=False, floatPrecision=None):
     """
     Checks if the current state of the item is different than the desired new
@@ -146,17 +353,21 @@ def post_update_if_different(item_or_item_name, new_value, sendACommand=False, f
     Returns:
         bool: ``True``, if the command or update was sent, else ``False``
     """
-    compare_value = None
     item = itemRegistry.getItem(item_or_item_name) if isinstance(item_or_item_name, basestring) else item_or_item_name
+    accepted_types = item.acceptedCommandTypes if sendACommand else item.acceptedDataTypes
+    return _post_if_different(item, new_value, accepted_types, sendACommand, floatPrecision)
 
-    if sendACommand:
-        compare_value = TypeParser.parseCommand(item.acceptedCommandTypes, str(new_value))
-    else:
-        compare_value = TypeParser.parseState(item.acceptedDataTypes, str(new_value))
+
+def _post_if_different(item, new_value, accepted_types, sendACommand, floatPrecision):
+    compare_value = _parse(sendACommand, accepted_types, str(new_value))
 
     if compare_value is not None:
         if item.state != compare_value or (isinstance(new_value, float) and floatPrecision is not None and round(item.state.floatValue(), floatPrecision) != new_value):
-            if sendACommand:
+            update_buffer = getattr(_ACTIVE_UPDATE_BUFFER, "buffer", None)
+            if update_buffer is not None:
+                update_buffer._add(item, new_value, sendACommand)
+                LOG.debug(u"Buffered {} value for '{}' is '{}'".format("sendCommand" if sendACommand else "postUpdate", item.name, new_value))
+            elif sendACommand:
                 events.sendCommand(item, new_value)
                 LOG.debug(u"New sendCommand value for '{}' is '{}'".format(item.name, new_value))
             else:
@@ -164,6 +375,11 @@ def post_update_if_different(item_or_item_name, new_value, sendACommand=False, f
                 LOG.debug(u"New postUpdate value for '{}' is '{}'".format(item.name, new_value))
             return True
         else:
+            update_buffer = getattr(_ACTIVE_UPDATE_BUFFER, "buffer", None)
+            if update_buffer is not None:
+                # the Item is to stay as it is, so a value buffered earlier
+                # must not be sent either
+                update_buffer._remove(item.name)
             LOG.debug(u"Not {} {} to '{}' since it is the same as the current state".format("sending command" if sendACommand else "posting update", new_value, item.name))
             return False
     else:
@@ -186,6 +402,207 @@ postUpdateCheckFirst = post_update_if_different
 sendCommandCheckFirst = send_command_if_different
 
 
+def post_updates_if_different(new_values, sendACommand=False, floatPrecision=None):
+    """
+    Does the same as ``post_update_if_different`` for many Items at once.
+    Item names are resolved with the cache used by ``validate_item`` and the
+    list of accepted types is only looked up once per Item type, so this is
+    cheaper than calling ``post_update_if_different`` repeatedly.
+
+    Examples:
+        .. code-block::
+
+            changed = post_updates_if_different({"Entry_Timer": OFF, "Exit_Timer": OFF, "Zone_Status": "Normal"})
+
+    Args:
+        new_values (dict): a dict of Items or Item names to the new State, or
+            Command if using sendACommand
+        sendACommand (Boolean): (optional) ``True`` to send commands instead
+            of updates
+        floatPrecision (int): (optional) the precision of the Items' states to
+            use when comparing values
+
+    Returns:
+        set: the names of the Items that were sent a command or update
+    """
+    changed = set()
+    accepted_types_by_type = {}
+    for item_or_item_name, new_value in new_values.items():
+        item = _get_item(item_or_item_name) if isinstance(item_or_item_name, basestring) else item_or_item_name
+        if item is None:
+            LOG.warn(u"'{}' is not in the ItemRegistry".format(item_or_item_name))
+            continue
+        # a Group's accepted types depend on its base Item
+        type_key = (item.type, item.baseItem.type if item.type == "Group" and item.baseItem is not None else None)
+        accepted_types = accepted_types_by_type.get(type_key)
+        if accepted_types is None:
+            accepted_types = item.acceptedCommandTypes if sendACommand else item.acceptedDataTypes
+            accepted_types_by_type[type_key] = accepted_types
+        if _post_if_different(item, new_value, accepted_types, sendACommand, floatPrecision):
+            changed.add(item.name)
+    return changed
+
+
+def send_commands_if_different(new_values, floatPrecision=None):
+    """
+    See post_updates_if_different
+    """
+    return post_updates_if_different(new_values, sendACommand=True, floatPrecision=floatPrecision)
+
+
+class UpdateBuffer(object):
+    """
+    Collects updates and commands for Items and only keeps the last one for
+    each Item, so that a rule that computes a value several times only puts
+    the final value on the event bus. Nothing is sent until ``flush`` is
+    called, which happens automatically when the buffer is used as a context
+    manager and the block completes without an exception. If the block
+    raises an exception, the buffered values are discarded. Within the block,
+    ``post_update_if_different`` and the other ``*_if_different`` functions
+    of this module also send to the buffer. To buffer a whole rule, use
+    ``buffered_updates``.
+
+    Examples:
+        .. code-block::
+
+            with UpdateBuffer() as buffer:
+                for index in range(1, 8):
+                    buffer.postUpdate("gForecast_Condition_{}".format(index), "Clear")
+                    buffer.postUpdate("gForecast_Condition_{}".format(index), get_condition(index))
+                buffer.sendCommand("Forecast_Refresh", "ON")
+
+            buffer = UpdateBuffer()
+            buffer.postUpdate("Weather_Temperature", "20.4")
+            buffer.postUpdate("Weather_Temperature", "20.5")
+            buffer.flush()# only 20.5 is posted
+    """
+
+    def __init__(self):
+        # {item name: (Item or item name, value, sendACommand)}, in the order
+        # of the last call for each Item
+        self._pending = OrderedDict()
+        self._lock = RLock()
+        self._previous = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __enter__(self):
+        self._previous = getattr(_ACTIVE_UPDATE_BUFFER, "buffer", None)
+        _ACTIVE_UPDATE_BUFFER.buffer = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _ACTIVE_UPDATE_BUFFER.buffer = self._previous
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+        return False
+
+    def _add(self, item_or_item_name, new_value, sendACommand):
+        item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+        with self._lock:
+            # remove first, so that the Item moves to the end of the flush order
+            self._pending.pop(item_name, None)
+            self._pending[item_name] = (item_or_item_name, new_value, sendACommand)
+
+    def _remove(self, item_name):
+        with self._lock:
+            self._pending.pop(item_name, None)
+
+    def postUpdate(self, item_or_item_name, new_value):
+        """
+        Buffers an update for an Item, replacing any update or command that
+        is already buffered for it.
+
+        Args:
+            item_or_item_name (Item or str): the Item or name of the Item
+            new_value (State or str): the State to update the Item with
+        """
+        self._add(item_or_item_name, new_value, False)
+
+    def sendCommand(self, item_or_item_name, new_value):
+        """
+        Buffers a command for an Item, replacing any update or command that
+        is already buffered for it.
+
+        Args:
+            item_or_item_name (Item or str): the Item or name of the Item
+            new_value (Command or str): the Command to send to the Item
+        """
+        self._add(item_or_item_name, new_value, True)
+
+    def flush(self):
+        """
+        Sends the buffered updates and commands and empties the buffer.
+
+        Returns:
+            int: the number of updates and commands that were sent
+        """
+        with self._lock:
+            pending = self._pending.values()
+            self._pending.clear()
+        for item_or_item_name, new_value, sendACommand in pending:
+            if sendACommand:
+                events.sendCommand(item_or_item_name, new_value)
+            else:
+                events.postUpdate(item_or_item_name, new_value)
+        LOG.debug(u"UpdateBuffer: sent {} updates and commands".format(len(pending)))
+        return len(pending)
+
+    def discard(self):
+        """
+        Empties the buffer without sending anything.
+        """
+        with self._lock:
+            self._pending.clear()
+
+
+# the UpdateBuffer that the *_if_different functions send to in this thread
+_ACTIVE_UPDATE_BUFFER = local()
+
+
+def buffered_updates(function):
+    """
+    Decorator that buffers the ``*_if_different`` updates and commands made
+    while ``function`` runs and sends them when it returns. Only the last
+    value for each Item is sent, so this is used on rules that may update the
+    same Item several times. The buffer is also flushed if ``function`` raises
+    an exception, so that nothing is lost compared to sending right away. If
+    a buffer is already active, e.g. when called from another buffered
+    function, the updates go to that buffer.
+
+    Examples:
+        .. code-block::
+
+            @rule("Reset zone")
+            @when("Item Zone_Reset received command ON")
+            @buffered_updates
+            def reset_zone(event):
+                post_updates_if_different({"Entry_Timer": OFF, "Exit_Timer": OFF})
+                post_update_if_different("Entry_Timer", OFF)# not sent twice
+
+    Args:
+        function (function): the function to wrap
+
+    Returns:
+        function: the wrapped function
+    """
+    @wraps(function)
+    def buffered(*args, **kwargs):
+        if getattr(_ACTIVE_UPDATE_BUFFER, "buffer", None) is not None:
+            return function(*args, **kwargs)
+        update_buffer = UpdateBuffer()
+        _ACTIVE_UPDATE_BUFFER.buffer = update_buffer
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _ACTIVE_UPDATE_BUFFER.buffer = None
+            update_buffer.flush()
+    return buffered
+
+
 def kw(dictionary, value):
     """
     In a given dictionary, get the first key that has a value matching the one provided.
@@ -220,6 +637,447 @@ def iround(float_value):
     return int(rounded) + (rounded > 0)
 
 
+class _ItemStateAccessor(object):
+    """
+    Returns the converted State of an Item when called. The Item is resolved
+    once and only resolved again after the ItemRegistry has changed.
+    """
+    __slots__ = ["item_name", "default", "_convert", "_resolved"]
+
+    def __init__(self, item_name, default, convert):
+        self.item_name = item_name
+        self.default = default
+        self._convert = convert
+        # (ItemRegistry generation, Item or None), replaced as a whole so
+        # that concurrent callers never pair an Item with the wrong generation
+        self._resolved = (None, None)
+
+    def __call__(self):
+        generation, item = self._resolved
+        if generation != _CACHE_GENERATION[0]:
+            generation = _CACHE_GENERATION[0]
+            item = _get_item(self.item_name)
+            self._resolved = (generation, item)
+            if item is None:
+                LOG.warn(u"'{}' is not in the ItemRegistry".format(self.item_name))
+        if item is None:
+            return self.default
+        state = item.state
+        if isinstance(state, UnDefType):
+            return self.default
+        value = self._convert(state)
+        return self.default if value is None else value
+
+    def __repr__(self):
+        return u"<{} for '{}' (default {})>".format(self._convert.__name__, self.item_name, self.default)
+
+
+def _to_float(state):
+    return state.floatValue()
+
+
+def _to_int(state):
+    return state.intValue()
+
+
+def _to_onoff(state):
+    if isinstance(state, OnOffType):
+        return state
+    elif isinstance(state, DecimalType):
+        return ON if state.doubleValue() != 0 else OFF
+    return None
+
+
+def _get_accessor(item_or_item_name, default, convert):
+    item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+    # the type is part of the key, because 0, 0.0 and False are equal
+    key = (convert, item_name, type(default), default)
+    accessor = _ACCESSORS.get(key)
+    if accessor is None:
+        _ensure_cache_listeners()
+        accessor = _ACCESSORS.setdefault(key, _ItemStateAccessor(item_name, default, convert))
+    return accessor
+
+
+def item_float(item_or_item_name, default=0.0):
+    """
+    Returns an accessor that, when called, returns the State of the Item as
+    a float, or the default if the Item's State is NULL or UNDEF or the Item
+    does not exist. The accessor only resolves the Item again after the
+    ItemRegistry has changed, so it is cheap to call repeatedly. Accessors
+    are shared, so calling this function again with the same arguments
+    returns the same accessor.
+
+    Examples:
+        .. code-block::
+
+            outdoor_temperature = item_float("Outdoor_Temperature", 0.0)
+            ...
+            temperature = outdoor_temperature()
+
+            # create the accessors once, not each time a value is read
+            humidity_sensors = dict((name, item_float(name)) for name in ["Humidity_1", "Humidity_2"])
+            ...
+            humidity = humidity_sensors[sensor_name]()
+
+    Args:
+        item_or_item_name (Item or str): the Item or name of the Item
+        default (float): (optional) the value to return if the Item has no
+            State, defaults to ``0.0``
+
+    Returns:
+        callable: a function without arguments that returns the State of the
+        Item as a float
+    """
+    return _get_accessor(item_or_item_name, default, _to_float)
+
+
+def item_int(item_or_item_name, default=0):
+    """
+    Same as ``item_float``, but the accessor returns the State of the Item as
+    an int.
+
+    Args:
+        item_or_item_name (Item or str): the Item or name of the Item
+        default (int): (optional) the value to return if the Item has no
+            State, defaults to ``0``
+
+    Returns:
+        callable: a function without arguments that returns the State of the
+        Item as an int
+    """
+    return _get_accessor(item_or_item_name, default, _to_int)
+
+
+def item_onoff(item_or_item_name, default=OFF):
+    """
+    Same as ``item_float``, but the accessor returns ``ON`` or ``OFF``. For a
+    Dimmer or Number Item, any value other than 0 is ``ON``. For an Item with
+    a State that cannot be converted, the default is returned.
+
+    Args:
+        item_or_item_name (Item or str): the Item or name of the Item
+        default (OnOffType): (optional) the value to return if the Item has
+            no State, defaults to ``OFF``
+
+    Returns:
+        callable: a function without arguments that returns the State of the
+        Item as ``ON`` or ``OFF``
+    """
+    return _get_accessor(item_or_item_name, default, _to_onoff)
+
+
+class _StateSnapshot(Mapping):
+    """
+    A read-only mapping of Item names to the States they had when the
+    snapshot was taken.
+    """
+    __slots__ = ["_states"]
+
+    def __init__(self, states):
+        self._states = states
+
+    def __getitem__(self, item_name):
+        return self._states[item_name]
+
+    def __contains__(self, item_name):
+        return item_name in self._states
+
+    def __iter__(self):
+        return iter(self._states)
+
+    def __len__(self):
+        return len(self._states)
+
+    def get(self, item_name, default=None):
+        return self._states.get(item_name, default)
+
+    def __repr__(self):
+        return u"<snapshot {}>".format(self._states)
+
+
+def snapshot(names_or_group):
+    """
+    Reads the States of several Items in a single pass and returns them as
+    an immutable mapping of Item names to States, so that a rule can work
+    with a consistent set of values instead of reading each Item from the
+    ItemRegistry as it goes. If a Group Item or the name of a Group Item is
+    passed, the snapshot contains the States of all of its members,
+    including the members of nested Groups. To include the State of a Group
+    Item itself, pass its name in a list. Items that are not in the
+    ItemRegistry are left out of the snapshot.
+
+    Examples:
+        .. code-block::
+
+            states = snapshot(["Outdoor_Temperature", "Outdoor_Humidity"])
+            if states["Outdoor_Temperature"] != NULL:
+                ...
+
+            open_doors = [name for name, state in snapshot("gDoors").items() if state == OPEN]
+
+    Args:
+        names_or_group (list, Item or str): a list of Items or Item names, a
+            Group Item or the name of a Group Item
+
+    Returns:
+        Mapping: the Item names mapped to their States
+    """
+    group = _get_item(names_or_group) if isinstance(names_or_group, basestring) else names_or_group
+    if hasattr(group, "getAllMembers"):
+        items = group.getAllMembers()
+    elif isinstance(names_or_group, basestring) or hasattr(names_or_group, "name"):
+        items = [names_or_group]
+    else:
+        items = names_or_group
+    states = {}
+    for item_or_item_name in items:
+        item = _get_item(item_or_item_name) if isinstance(item_or_item_name, basestring) else item_or_item_name
+        if item is None:
+            LOG.warn(u"'{}' is not in the ItemRegistry".format(item_or_item_name))
+            continue
+        states[item.name] = item.state
+    return _StateSnapshot(states)
+
+
+class _LastUpdateSubscriber(EventSubscriber):
+
+    def getSubscribedEventTypes(self):
+        return Collections.singleton(ItemStateEvent.TYPE)
+
+    def getEventFilter(self):
+        return None
+
+    def receive(self, event):
+        _LAST_UPDATES[event.itemName] = System.currentTimeMillis()
+
+
+def _ensure_last_update_subscriber():
+    if _LAST_UPDATE_SUBSCRIBER:
+        return
+    with _LAST_UPDATE_LOCK:
+        if not _LAST_UPDATE_SUBSCRIBER:
+            from core.osgi import BUNDLE_CONTEXT
+            subscriber = _LastUpdateSubscriber()
+            # registered directly, as register_service would replace the
+            # entry of any other EventSubscriber in REGISTERED_SERVICES
+            registration = BUNDLE_CONTEXT.registerService([_EVENT_SUBSCRIBER_CLASS], subscriber, None)
+            _LAST_UPDATE_SUBSCRIBER.append((subscriber, registration))
+            LOG.debug(u"Started tracking Item updates")
+
+
+def last_updates(items_or_item_names):
+    """
+    Returns the time of the last update of several Items in epoch
+    milliseconds. Updates are tracked from ItemStateEvents once this function
+    or ``last_update`` has been called for the first time, so persistence is
+    only queried for Items that have not been updated since then, and only
+    once for each Item. This means that the result does not depend on the
+    persistence strategy for the Item, unless the Item has not been updated
+    since tracking started. PersistenceExtensions has no query for several
+    Items, so each of those Items is still queried separately, but only the
+    first time it is requested.
+
+    Examples:
+        .. code-block::
+
+            updates = last_updates(["Door_Sensor", "Window_Sensor"])
+            dead = [name for name, millis in updates.items() if millis is None or millis < DateTime.now().minusMinutes(60).millis]
+
+    Args:
+        items_or_item_names (list): a list of Items or Item names
+
+    Returns:
+        dict: the Item names mapped to the epoch milliseconds of their last
+        update, 0 if there is no record of an update, or ``None`` if the
+        Item does not exist or persistence could not be queried
+    """
+    _ensure_last_update_subscriber()
+    result = {}
+    missing = []
+    for item_or_item_name in items_or_item_names:
+        item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+        millis = _LAST_UPDATES.get(item_name)
+        result[item_name] = millis
+        if millis is None:
+            missing.append(item_or_item_name)
+    if missing:
+        from core.actions import PersistenceExtensions
+        for item_or_item_name in missing:
+            item = _get_item(item_or_item_name) if isinstance(item_or_item_name, basestring) else item_or_item_name
+            if item is None:
+                LOG.warn(u"'{}' is not in the ItemRegistry".format(item_or_item_name))
+                continue
+            try:
+                last_update = PersistenceExtensions.lastUpdate(item)
+                millis = to_epoch_millis(last_update) if last_update is not None else 0
+            except:
+                LOG.warn(u"Exception when getting lastUpdate data for item: '{}'".format(item.name))
+                continue
+            with _LAST_UPDATE_LOCK:
+                # an update that arrived during the query is more recent
+                result[item.name] = _LAST_UPDATES.setdefault(item.name, millis)
+    return result
+
+
+def last_update(item_or_item_name):
+    """
+    Returns the time of the last update of an Item in epoch milliseconds. See
+    ``last_updates`` for how updates are tracked.
+
+    Args:
+        item_or_item_name (Item or str): the Item or name of the Item
+
+    Returns:
+        int or None: the epoch milliseconds of the last update, 0 if there
+        is no record of an update, or ``None`` if the Item does not exist or
+        persistence could not be queried
+    """
+    item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+    millis = _LAST_UPDATES.get(item_name)
+    if millis is not None:
+        return millis
+    return last_updates([item_or_item_name])[item_name]
+
+
+def stop_last_update_tracking():
+    """
+    Stops tracking Item updates and forgets the tracked times, so that the
+    event subscriber is not left registered, e.g. before reloading this
+    module. Tracking is shared by all scripts and starts again the next time
+    ``last_update`` or ``last_updates`` is called.
+    """
+    with _LAST_UPDATE_LOCK:
+        if _LAST_UPDATE_SUBSCRIBER:
+            _, registration = _LAST_UPDATE_SUBSCRIBER.pop()
+            registration.unregister()
+            LOG.debug(u"Stopped tracking Item updates")
+        _LAST_UPDATES.clear()
+
+
+def _set_filter_dates(criteria, start_millis, end_millis):
+    try:
+        criteria.setBeginDate(ZonedDateTime.ofInstant(Instant.ofEpochMilli(start_millis), ZoneId.systemDefault()))
+        criteria.setEndDate(ZonedDateTime.ofInstant(Instant.ofEpochMilli(end_millis), ZoneId.systemDefault()))
+    except TypeError:
+        # FilterCriteria takes java.util.Date before openHAB 2.5
+        criteria.setBeginDate(Date(start_millis))
+        criteria.setEndDate(Date(end_millis))
+
+
+def _state_to_float(state):
+    if hasattr(state, "floatValue"):
+        return state.floatValue()
+    elif state in (ON, OPEN):
+        return 1.0
+    elif state in (OFF, CLOSED):
+        return 0.0
+    return None
+
+
+def history(item_or_item_name, start, end=None, chunk=1000, service_id=None):
+    """
+    Returns a generator of the persisted States of an Item between ``start``
+    and ``end`` as ``(epoch milliseconds, float)`` tuples, oldest first. The
+    persistence service is queried ``chunk`` entries at a time as the
+    generator is consumed, each query starting at the timestamp of the last
+    entry of the previous one, so long periods can be processed without
+    loading them into memory at once. If more than ``chunk`` entries share a
+    timestamp, use a larger ``chunk``, since entries after the first
+    ``chunk`` at that timestamp cannot be reached. ON and OPEN are returned as 1.0, OFF and CLOSED
+    as 0.0, and States that cannot be converted to a number are skipped.
+
+    Examples:
+        .. code-block::
+
+            total = count = 0
+            for timestamp, value in history("Outdoor_Temperature", ZonedDateTime.now().minusWeeks(4)):
+                total += value
+                count += 1
+
+    Args:
+        item_or_item_name (Item or str): the Item or name of the Item
+        start: the start of the period, as any type supported by
+            ``core.date`` or epoch milliseconds
+        end: (optional) the end of the period, defaults to now
+        chunk (int): (optional) the number of entries to query at a time,
+            defaults to 1000
+        service_id (str): (optional) the ID of the persistence service to
+            query, defaults to the default persistence service
+
+    Returns:
+        generator: a generator of ``(epoch milliseconds, float)`` tuples
+
+    Raises:
+        ValueError: if the persistence service is not available or cannot
+            be queried
+    """
+    try:
+        from org.openhab.core.persistence import FilterCriteria, QueryablePersistenceService
+    except:
+        from org.eclipse.smarthome.core.persistence import FilterCriteria, QueryablePersistenceService
+    from core import osgi
+
+    item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+    registry = osgi.get_service(
+            "org.openhab.core.persistence.PersistenceServiceRegistry"
+        ) or osgi.get_service(
+            "org.eclipse.smarthome.core.persistence.PersistenceServiceRegistry"
+        )
+    service = None
+    if registry is not None:
+        service = registry.getDefault() if service_id is None else registry.get(service_id)
+    if not isinstance(service, QueryablePersistenceService):
+        raise ValueError(u"'{}' is not an available queryable persistence service".format(service_id or "default"))
+
+    criteria = FilterCriteria()
+    criteria.setItemName(item_name)
+    criteria.setOrdering(FilterCriteria.Ordering.ASCENDING)
+    criteria.setPageSize(chunk)
+    criteria.setPageNumber(0)
+    start_millis = to_epoch_millis(start)
+    end_millis = System.currentTimeMillis() if end is None else to_epoch_millis(end)
+
+    def _generator():
+        begin_millis = start_millis
+        # the number of entries at begin_millis that were already yielded
+        skip = 0
+        while True:
+            _set_filter_dates(criteria, begin_millis, end_millis)
+            returned = 0
+            skipped = 0
+            count = 0
+            last_millis = None
+            at_last_millis = 0
+            for historic_item in service.query(criteria):
+                timestamp = to_epoch_millis(historic_item.timestamp)
+                if timestamp < begin_millis:
+                    continue
+                returned += 1
+                if timestamp == begin_millis and skipped < skip:
+                    skipped += 1
+                    continue
+                count += 1
+                if timestamp == last_millis:
+                    at_last_millis += 1
+                else:
+                    last_millis = timestamp
+                    at_last_millis = 1
+                value = _state_to_float(historic_item.state)
+                if value is not None:
+                    yield (timestamp, value)
+            if count == 0 or returned < chunk:
+                break
+            # the next page starts at the last timestamp, as some services,
+            # like rrd4j, ignore the page number. Entries at that timestamp
+            # that were already yielded are skipped, so that entries sharing
+            # a timestamp across the page boundary are not lost.
+            skip = at_last_millis + (skipped if last_millis == begin_millis else 0)
+            begin_millis = last_millis
+
+    return _generator()
+
+
 def getItemValue(item_or_item_name, default_value):
     """
     Returns the Item's value if the Item exists and is initialized, otherwise
@@ -266,19 +1124,16 @@ def getLastUpdate(item_or_item_name):
         DateTime: DateTime representing the time of the Item's last update
     """
     LOG.warn("The 'core.utils.getLastUpdate' function is pending deprecation.")
-    try:
-        from core.actions import PersistenceExtensions
-        item = itemRegistry.getItem(item_or_item_name) if isinstance(item_or_item_name, basestring) else item_or_item_name
-        last_update = PersistenceExtensions.lastUpdate(item)
-        if last_update is None:
-            LOG.warning(u"No existing lastUpdate data for item: '{}', so returning 1970-01-01T00:00:00Z".format(item.name))
-            return DateTime(0)
-        return last_update.toDateTime()
-    except:
+    item_name = item_or_item_name if isinstance(item_or_item_name, basestring) else item_or_item_name.name
+    millis = last_update(item_or_item_name)
+    if millis is None:
         # There is an issue using the StartupTrigger and saving scripts over SMB, where changes are detected before the file
         # is completely written. The first read breaks because of a partial file write and the second read succeeds.
-        LOG.warning(u"Exception when getting lastUpdate data for item: '{}', so returning 1970-01-01T00:00:00Z".format(item.name))
+        LOG.warning(u"Exception when getting lastUpdate data for item: '{}', so returning 1970-01-01T00:00:00Z".format(item_name))
         return DateTime(0)
+    if millis == 0:
+        LOG.warning(u"No existing lastUpdate data for item: '{}', so returning 1970-01-01T00:00:00Z".format(item_name))
+    return DateTime(millis)
 
 
 def sendCommand(item_or_item_name, new_value):
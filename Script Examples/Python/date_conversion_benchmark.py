@@ -0,0 +1,56 @@
+"""
+This script measures the time needed by each of the conversion functions in
+``core.date`` for each of the supported date types. Every pair is run
+``ITERATIONS`` times and the results are logged as microseconds per call.
+"""
+import time
+import datetime
+
+from java.time import LocalDateTime, ZonedDateTime
+from java.util import Calendar, Date
+from org.joda.time import DateTime
+
+try:
+    from org.openhab.core.library.types import DateTimeType
+except:
+    from org.eclipse.smarthome.core.library.types import DateTimeType
+
+from core.log import logging, LOG_PREFIX
+from core.date import format_date, to_java_zoneddatetime, to_java_calendar, to_python_datetime, to_joda_datetime, to_epoch_millis
+
+log = logging.getLogger("{}.date_conversion_benchmark".format(LOG_PREFIX))
+
+ITERATIONS = 10000
+
+VALUES = [
+    ("ZonedDateTime", ZonedDateTime.now()),
+    ("LocalDateTime", LocalDateTime.now()),
+    ("datetime", datetime.datetime.now()),
+    ("datetime with tzinfo", to_python_datetime(ZonedDateTime.now())),
+    ("Calendar", Calendar.getInstance()),
+    ("Date", Date()),
+    ("Joda DateTime", DateTime.now()),
+    ("DateTimeType", DateTimeType())
+]
+
+CONVERTERS = [
+    ("to_java_zoneddatetime", to_java_zoneddatetime),
+    ("to_java_calendar", to_java_calendar),
+    ("to_python_datetime", to_python_datetime),
+    ("to_joda_datetime", to_joda_datetime),
+    ("format_date", format_date),
+    ("to_epoch_millis", to_epoch_millis)
+]
+
+
+def benchmark(converter, value):
+    converter(value)# warm up any caches
+    start = time.time()
+    for _ in xrange(ITERATIONS):
+        converter(value)
+    return (time.time() - start) * 1000000 / ITERATIONS
+
+
+for converter_name, converter in CONVERTERS:
+    results = ["{}: {:.2f}us".format(value_name, benchmark(converter, value)) for value_name, value in VALUES]
+    log.info("{} ({} calls each): {}".format(converter_name, ITERATIONS, ", ".join(results)))
@@ -0,0 +1,68 @@
+"""
+This script checks that ``core.date.human_readable_seconds`` returns the same
+strings as the implementation it replaced, and compares the time needed by
+the old implementation, ``human_readable_seconds`` and
+``human_readable_seconds_list``. The results are logged.
+"""
+import random
+import time
+
+from core.log import logging, LOG_PREFIX
+from core.date import human_readable_seconds, human_readable_seconds_list
+
+log = logging.getLogger("{}.human_readable_seconds_benchmark".format(LOG_PREFIX))
+
+ITERATIONS = 100000
+
+
+def previous_human_readable_seconds(seconds):
+    seconds = int(round(seconds))
+    number_of_days = seconds//86400
+    number_of_hours = (seconds%86400)//3600
+    number_of_minutes = (seconds%3600)//60
+    number_of_seconds = (seconds%3600)%60
+
+    days_string = "{} day{}".format(number_of_days, "s" if number_of_days > 1 else "")
+    hours_string = "{} hour{}".format(number_of_hours, "s" if number_of_hours > 1 else "")
+    minutes_string = "{} minute{}".format(number_of_minutes, "s" if number_of_minutes > 1 else "")
+    seconds_string = "{} second{}".format(number_of_seconds, "s" if number_of_seconds > 1 else "")
+
+    return "{}{}{}{}{}{}{}".format(
+        days_string if number_of_days > 0 else "",
+        "" if number_of_days == 0 or (number_of_hours == 0 and number_of_minutes == 0) else (
+            " and " if (number_of_hours > 0 and number_of_minutes == 0 and number_of_seconds == 0) or (number_of_hours == 0 and number_of_minutes > 0 and number_of_seconds == 0) else ", "
+        ),
+        hours_string if number_of_hours > 0 else "",
+        "" if number_of_hours == 0 or number_of_minutes == 0 else (
+            " and " if number_of_minutes > 0 and number_of_seconds == 0 else ", "
+        ),
+        minutes_string if number_of_minutes > 0 else "",
+        " and " if number_of_seconds > 0 and (number_of_minutes > 0 or number_of_hours > 0 or number_of_days > 0) else "",
+        seconds_string if number_of_seconds > 0 else ""
+    )
+
+
+mismatches = [seconds for seconds in range(-100000, 300000, 7) if human_readable_seconds(seconds) != previous_human_readable_seconds(seconds)]
+if mismatches:
+    log.error("human_readable_seconds differs from the previous implementation for: {}".format(mismatches[:10]))
+else:
+    log.info("human_readable_seconds matches the previous implementation")
+
+durations = [random.randint(0, 3 * 86400) for _ in xrange(ITERATIONS)]
+
+start = time.time()
+for seconds in durations:
+    previous_human_readable_seconds(seconds)
+previous_time = time.time() - start
+
+start = time.time()
+for seconds in durations:
+    human_readable_seconds(seconds)
+current_time = time.time() - start
+
+start = time.time()
+human_readable_seconds_list(durations)
+list_time = time.time() - start
+
+log.info("{} durations: previous implementation: {:.3f}s, human_readable_seconds: {:.3f}s, human_readable_seconds_list: {:.3f}s".format(
+    ITERATIONS, previous_time, current_time, list_time))
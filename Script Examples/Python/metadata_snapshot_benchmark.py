@@ -0,0 +1,57 @@
+"""
+This script compares the time needed to provision Item metadata with one
+``set_metadata`` call per Item against loading the same metadata from a
+snapshot with ``import_snapshot``. The metadata is created in a throwaway
+namespace and is removed when the script finishes. The results are logged.
+"""
+import os
+import tempfile
+import time
+
+from core.log import logging, LOG_PREFIX
+from core.metadata import set_metadata, remove_metadata, items_with_namespace, export_snapshot, import_snapshot, metadata_batch
+
+log = logging.getLogger("{}.metadata_snapshot_benchmark".format(LOG_PREFIX))
+
+NAMESPACE = "metadata_snapshot_benchmark"
+ITEM_COUNT = 2000
+CONFIGURATION = {
+    "light_action": {
+        "lux_item_name": "Benchmark_Lux",
+        "active": {"modes": {"Morning": {"lux_trigger": 0, "low_lux": {"brightness": 1}}}}
+    }
+}
+
+
+def remove_benchmark_metadata():
+    with metadata_batch():
+        for item_name in items_with_namespace(NAMESPACE):
+            remove_metadata(item_name, NAMESPACE)
+
+
+snapshot_path = os.path.join(tempfile.gettempdir(), "{}.snapshot".format(NAMESPACE))
+try:
+    start = time.time()
+    for index in range(ITEM_COUNT):
+        set_metadata("Benchmark_Item_{}".format(index), NAMESPACE, CONFIGURATION, "value", overwrite=True)
+    per_call_time = time.time() - start
+
+    start = time.time()
+    export_snapshot(snapshot_path, [NAMESPACE])
+    export_time = time.time() - start
+    remove_benchmark_metadata()
+
+    start = time.time()
+    import_snapshot(snapshot_path, mode="replace")
+    import_time = time.time() - start
+
+    start = time.time()
+    import_snapshot(snapshot_path, mode="replace")
+    reimport_time = time.time() - start
+
+    log.info("Metadata for {} Items: set_metadata per Item: {:.3f}s, export_snapshot: {:.3f}s ({} bytes), import_snapshot: {:.3f}s, import_snapshot when unchanged: {:.3f}s".format(
+        ITEM_COUNT, per_call_time, export_time, os.path.getsize(snapshot_path), import_time, reimport_time))
+finally:
+    remove_benchmark_metadata()
+    if os.path.exists(snapshot_path):
+        os.remove(snapshot_path)